@@ -1,17 +1,67 @@
 """Simple chatbot interface built with NiceGUI for Resume Roast demo."""
 
 import asyncio
+import functools
 import json
 import logging
 import os
-from typing import Dict, Optional, Set
+import secrets
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, ClassVar, Dict, Mapping, Optional, Set, Tuple
 
 import httpx
-from nicegui import run, ui
+from nicegui import app, run, ui
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 logger = logging.getLogger(__name__)
 
 
+class StreamingMarkdown:
+    """Markdown view that only re-renders the block still being streamed.
+    
+    Text up to the last blank line is treated as stable: it is rendered
+    once into its own markdown element and never updated again, so each
+    update only re-parses and re-sends the trailing block instead of the
+    full response. The trailing block is skipped entirely when the new
+    text would not change what is rendered.
+    """
+    
+    def __init__(self, classes: str) -> None:
+        """Create the frozen block container and the trailing markdown element."""
+        self.classes = classes
+        self.frozen_length = 0
+        self.tail_content = ''
+        with ui.column().classes('w-full gap-0'):
+            self.frozen = ui.column().classes('w-full gap-0')
+            self.tail = ui.markdown('').classes(classes)
+    
+    def update(self, content: str) -> None:
+        """Freeze newly completed blocks and re-render the trailing one."""
+        boundary = content.rfind('\n\n', self.frozen_length)
+        # Never split inside an unterminated fenced code block
+        if boundary != -1 and content.count('```', 0, boundary) % 2 == 0:
+            stable = content[self.frozen_length:boundary]
+            if stable.strip():
+                with self.frozen:
+                    ui.markdown(stable).classes(self.classes)
+            self.frozen_length = boundary + 2
+        
+        # Trailing whitespace does not change the rendered markdown
+        tail_content = content[self.frozen_length:].rstrip()
+        if tail_content != self.tail_content:
+            self.tail_content = tail_content
+            self.tail.content = tail_content
+
+
 class ResumeRoastUI:
     """Main UI class for Resume Roast chatbot interface.
     
@@ -19,11 +69,34 @@ class ResumeRoastUI:
     resumes and receive AI-powered feedback through a chat interface.
     """
     
+    # Seconds between markdown re-renders while an agent is streaming
+    RENDER_INTERVAL = 0.1
+    
+    # Compact stream format served by the backend (see api.routes)
+    STREAM_MEDIA_TYPE = 'application/x-ndjson+rr'
+    
+    # Agent card styling
+    _AGENT_EMOJI: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {'Critic': '🔍', 'Advocate': '💪', 'Realist': '⚖️'}
+    )
+    _AGENT_BIT: ClassVar[Mapping[str, int]] = MappingProxyType(
+        {'Critic': 1, 'Advocate': 2, 'Realist': 4}
+    )
+    _BTN_UP_CLASSES = 'px-3 py-1 bg-gray-200 hover:bg-green-500 hover:text-white rounded-full text-sm transition-colors'
+    _BTN_DOWN_CLASSES = 'px-3 py-1 bg-gray-200 hover:bg-red-500 hover:text-white rounded-full text-sm transition-colors'
+    
     def __init__(self) -> None:
         """Initialize the Resume Roast UI."""
         self.api_base_url = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
         self.current_session_id: Optional[str] = None
-        self.agents_completed: Set[str] = set()
+        self._completed_mask = 0  # Bitwise OR of _AGENT_BIT for completed agents
+        
+        # Shared HTTP client, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Page visibility, mirrored from the browser while streaming
+        self.page_visible = True
+        self._on_page_visible: Optional[Callable[[], None]] = None
         
         # UI components
         self.chat_container = None
@@ -36,6 +109,21 @@ class ResumeRoastUI:
         self.feedback_input = None
         self.pending_feedback = {'agent_name': None, 'thumbs_up': None}
         
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def setup_theme(self) -> None:
         """Configure corporate blue theme."""
         ui.colors(
@@ -79,23 +167,26 @@ class ResumeRoastUI:
             return
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                feedback_data = {
-                    'session_id': str(self.current_session_id),
-                    'agent_name': self.pending_feedback['agent_name'].capitalize(),
-                    'thumbs_up': self.pending_feedback['thumbs_up'],
-                    'feedback_text': feedback_text
-                }
-                
-                response = await client.post(
-                    f'{self.api_base_url}/submit-feedback',
-                    json=feedback_data
-                )
-                
-                if response.status_code == 200:
-                    ui.notify('✅ Feedback submitted!', type='positive')
-                else:
-                    ui.notify(f'❌ Error: {response.status_code}', type='negative')
+            client = await self._get_client()
+            # Agent names arrive from the stream already in API form (e.g. 'Critic')
+            feedback_data = {
+                'session_id': str(self.current_session_id),
+                'agent_name': self.pending_feedback['agent_name'],
+                'thumbs_up': self.pending_feedback['thumbs_up'],
+                'feedback_text': feedback_text
+            }
+            
+            response = await client.post(
+                f'{self.api_base_url}/submit-feedback',
+                content=_dumps(feedback_data),
+                headers={'Content-Type': 'application/json'},
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                ui.notify('✅ Feedback submitted!', type='positive')
+            else:
+                ui.notify(f'❌ Error: {response.status_code}', type='negative')
         except Exception as e:
             ui.notify(f'❌ Error: {str(e)}', type='negative')
     
@@ -106,6 +197,50 @@ class ResumeRoastUI:
                 ui.label('💼 Resume Roast').classes('text-3xl font-bold')
                 ui.label('AI-Powered Professional Resume Analysis').classes('text-sm opacity-90')
     
+    @staticmethod
+    def _stream_multipart(
+        file, fields: Dict[str, str], chunk_size: int = 64 * 1024
+    ) -> Tuple[Dict[str, str], AsyncIterator[bytes]]:
+        """Build a streaming multipart/form-data body for an uploaded PDF.
+        
+        httpx only streams synchronous file objects passed via ``files=``,
+        so the body is assembled here to forward NiceGUI's async upload
+        chunk by chunk instead of reading the whole file into memory.
+        
+        Args:
+            file: NiceGUI file upload, sent as the ``file`` form field
+            fields: Additional text form fields
+            chunk_size: Bytes read from the upload per chunk
+            
+        Returns:
+            Request headers and an async iterator over the body
+        """
+        boundary = secrets.token_hex(16)
+        filename = file.name.replace('\\', '\\\\').replace('"', '%22')
+        head = ''.join(
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f'{value}\r\n'
+            for name, value in fields.items()
+        ).encode() + (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            'Content-Type: application/pdf\r\n\r\n'
+        ).encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            async for chunk in file.iterate(chunk_size=chunk_size):
+                yield chunk
+            yield tail
+        
+        headers = {
+            'Content-Type': f'multipart/form-data; boundary={boundary}',
+            'Content-Length': str(len(head) + file.size() + len(tail)),
+        }
+        return headers, body()
+    
     async def handle_file_upload(self, e):
         """Handle PDF file upload."""
         try:
@@ -137,138 +272,222 @@ class ResumeRoastUI:
                 ).classes('mb-2')
             
             # Upload to API
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                file_content = await e.file.read()
-                files = {'file': (filename, file_content, 'application/pdf')}
-                data = {'job_description': job_description}
+            client = await self._get_client()
+            headers, body = self._stream_multipart(
+                e.file, {'job_description': job_description}
+            )
+            
+            response = await client.post(
+                f"{self.api_base_url}/upload-resume",
+                content=body,
+                headers=headers,
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                self.current_session_id = result['session_id']
                 
-                response = await client.post(
-                    f"{self.api_base_url}/upload-resume",
-                    files=files,
-                    data=data
-                )
+                # Open the analysis stream before rendering the confirmation
+                stream_task = asyncio.create_task(self._stream_in_chat())
+                await asyncio.gather(self._render_upload_success(loading_msg), stream_task)
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    self.current_session_id = result['session_id']
-                    
-                    # Remove loading message
-                    loading_msg.delete()
-                    
-                    with self.chat_container:
-                        ui.chat_message(
-                            '✅ Resume uploaded successfully! Starting AI analysis...',
-                            name='System',
-                            sent=False
-                        ).classes('mb-2')
-                    
-                    # Start streaming analysis
-                    await self.stream_agent_responses()
-                    
-                else:
-                    error_data = response.json()
-                    loading_msg.content = f'❌ Upload failed: {error_data.get("detail", "Unknown error")}'
-                    ui.notify('Upload failed. Please try again.', type='negative')
+            else:
+                error_data = response.json()
+                loading_msg.content = f'❌ Upload failed: {error_data.get("detail", "Unknown error")}'
+                ui.notify('Upload failed. Please try again.', type='negative')
         
         except Exception as ex:
             ui.notify(f'Error uploading file: {str(ex)}', type='negative')
     
+    async def _render_upload_success(self, loading_msg) -> None:
+        """Replace the loading message with the upload confirmation."""
+        loading_msg.delete()
+        
+        with self.chat_container:
+            ui.chat_message(
+                '✅ Resume uploaded successfully! Starting AI analysis...',
+                name='System',
+                sent=False
+            ).classes('mb-2')
+    
+    async def _stream_in_chat(self) -> None:
+        """Stream agent responses from a separate task.
+        
+        NiceGUI tracks the current slot per task, so the chat container is
+        entered explicitly for notifications raised while streaming.
+        """
+        with self.chat_container:
+            await self.stream_agent_responses()
+    
+    @staticmethod
+    async def _iter_frames(response: httpx.Response):
+        """Yield newline-delimited frames from a streaming response.
+        
+        Splits the raw bytes on bare newlines, since chunks inside JSON
+        frames are escaped and delta frames never contain line breaks.
+        Only complete frames are decoded; a newline byte never occurs
+        inside a multi-byte UTF-8 sequence.
+        """
+        buffer = bytearray()
+        async for raw in response.aiter_bytes(16384):
+            buffer += raw
+            start = 0
+            while (newline := buffer.find(b'\n', start)) != -1:
+                if newline > start:
+                    yield buffer[start:newline].decode()
+                start = newline + 1
+            del buffer[:start]
+    
     async def stream_agent_responses(self):
         """Stream agent responses from the API."""
         if not self.current_session_id:
             return
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                async with client.stream(
-                    'GET', 
-                    f"{self.api_base_url}/stream-analysis/{self.current_session_id}"
-                ) as response:
-                    
-                    if response.status_code != 200:
-                        ui.notify('Failed to start analysis stream.', type='negative')
+            client = await self._get_client()
+            async with client.stream(
+                'GET', 
+                f"{self.api_base_url}/stream-analysis/{self.current_session_id}",
+                headers={'Accept': self.STREAM_MEDIA_TYPE}
+            ) as response:
+                
+                if response.status_code != 200:
+                    ui.notify('Failed to start analysis stream.', type='negative')
+                    return
+                
+                current_agents = {}
+                agent_contents = {}  # Store accumulated content
+                feedback_rows: Dict[str, ui.row] = {}
+                flush_handles: Dict[str, asyncio.TimerHandle] = {}
+                loop = asyncio.get_running_loop()
+                
+                hidden_updates: Set[str] = set()
+                
+                def flush(name: str) -> None:
+                    """Render the accumulated markdown for one agent."""
+                    flush_handles.pop(name, None)
+                    if not self.page_visible:
+                        hidden_updates.add(name)
                         return
+                    current_agents[name].update(agent_contents[name])
+                
+                def render_hidden_updates() -> None:
+                    """Catch up on renders skipped while the tab was hidden."""
+                    for name in hidden_updates:
+                        current_agents[name].update(agent_contents[name])
+                    hidden_updates.clear()
+                
+                self._on_page_visible = render_hidden_updates
+                
+                async for line in self._iter_frames(response):
+                    try:
+                        frame_type = line[:1]
+                        if frame_type == 'D':
+                            # Text delta: D<TAB>agent_name<TAB>chunk
+                            _, agent_name, chunk = line.split('\t', 2)
+                            is_complete = False
+                        elif frame_type == 'J':
+                            data = _loads(line[1:])  # Control frame
+                            
+                            if data.get('error'):
+                                with self.chat_container:
+                                    ui.chat_message(
+                                        f'Error: {data["message"]}',
+                                        name='System',
+                                        sent=False
+                                    )
+                                break
+                            
+                            agent_name = data.get('agent_name')
+                            chunk = data.get('chunk', '')
+                            is_complete = data.get('is_complete', False)
+                        else:
+                            continue
+                    except ValueError:
+                        continue  # Skip malformed frames
                     
-                    current_agents = {}
-                    agent_contents = {}  # Store accumulated content
-                    
-                    async for line in response.aiter_lines():
-                        if line.startswith('data: '):
-                            try:
-                                data = json.loads(line[6:])  # Remove 'data: ' prefix
-                                
-                                if data.get('error'):
-                                    with self.chat_container:
-                                        ui.chat_message(
-                                            f'Error: {data["message"]}',
-                                            name='System',
-                                            sent=False
-                                        )
-                                    break
+                    if agent_name and agent_name != 'Workflow':
+                        # Initialize agent message if not exists
+                        if agent_name not in current_agents:
+                            # Initialize content accumulator
+                            agent_contents[agent_name] = ""
+                            
+                            with self.chat_container:
+                                emoji = self._AGENT_EMOJI.get(agent_name, '🤖')
                                 
-                                agent_name = data.get('agent_name')
-                                chunk = data.get('chunk', '')
-                                is_complete = data.get('is_complete', False)
+                                # Create container for agent response with professional styling
+                                with ui.card().classes('w-full mb-4 p-6 shadow-lg border-l-4 border-blue-500 bg-white'):
+                                    ui.label(f'{emoji} {agent_name}').classes('font-semibold text-xl mb-3 text-gray-800')
+                                    current_agents[agent_name] = StreamingMarkdown('w-full text-gray-700 prose max-w-none')
                                 
-                                if agent_name and agent_name != 'Workflow':
-                                    # Initialize agent message if not exists
-                                    if agent_name not in current_agents:
-                                        # Initialize content accumulator
-                                        agent_contents[agent_name] = ""
-                                        
-                                        with self.chat_container:
-                                            # Agent emoji mapping
-                                            emoji = {'Critic': '🔍', 'Advocate': '💪', 'Realist': '⚖️'}.get(agent_name, '🤖')
-                                            
-                                            # Create container for agent response with professional styling
-                                            with ui.card().classes('w-full mb-4 p-6 shadow-lg border-l-4 border-blue-500 bg-white'):
-                                                ui.label(f'{emoji} {agent_name}').classes('font-semibold text-xl mb-3 text-gray-800')
-                                                current_agents[agent_name] = ui.markdown('').classes('w-full text-gray-700 prose max-w-none')
-                                    
-                                    # Accumulate and update message content
-                                    if chunk:
-                                        agent_contents[agent_name] += chunk
-                                        # Update markdown content
-                                        current_agents[agent_name].content = agent_contents[agent_name]
-                                    
-                                    # Add feedback buttons when agent completes
-                                    if is_complete and agent_name not in self.agents_completed:
-                                        self.agents_completed.add(agent_name)
-                                        # Add feedback buttons below the agent response
-                                        with self.chat_container:
-                                            with ui.row().classes('justify-end mt-2 mb-4 gap-2'):
-                                                ui.label('Was this helpful?').classes('text-sm text-gray-600 self-center')
-                                                
-                                                thumbs_up_btn = ui.button(
-                                                    '👍', 
-                                                    on_click=lambda an=agent_name: asyncio.create_task(self.submit_feedback(an, True))
-                                                ).classes('px-3 py-1 bg-gray-200 hover:bg-green-500 hover:text-white rounded-full text-sm transition-colors')
-                                                
-                                                thumbs_down_btn = ui.button(
-                                                    '👎', 
-                                                    on_click=lambda an=agent_name: asyncio.create_task(self.submit_feedback(an, False))
-                                                ).classes('px-3 py-1 bg-gray-200 hover:bg-red-500 hover:text-white rounded-full text-sm transition-colors')
-                                                
-                                                # Store button references for state updates
-                                                self.feedback_buttons[agent_name] = {
-                                                    'up': thumbs_up_btn,
-                                                    'down': thumbs_down_btn
-                                                }
-                                
-                                # Check if workflow is complete
-                                if agent_name == 'Workflow' and is_complete:
-                                    with self.chat_container:
-                                        with ui.card().classes('w-full mb-4 p-4 bg-blue-50 border border-blue-200'):
-                                            ui.label('✅ Analysis Complete').classes('font-semibold text-lg text-blue-800 mb-2')
-                                            ui.label('Please provide feedback on the agent responses above to help improve future analyses.').classes('text-blue-700')
-                                    break
-                                    
-                            except json.JSONDecodeError:
-                                continue  # Skip malformed JSON
+                                # Placeholder keeps the feedback row below this card
+                                feedback_rows[agent_name] = ui.row().classes('justify-end gap-2')
+                        
+                        # Accumulate content and batch markdown re-renders
+                        if chunk:
+                            agent_contents[agent_name] += chunk
+                            if agent_name not in flush_handles:
+                                flush_handles[agent_name] = loop.call_later(
+                                    self.RENDER_INTERVAL, flush, agent_name
+                                )
+                        
+                        if is_complete:
+                            # Render immediately once the agent is done
+                            handle = flush_handles.get(agent_name)
+                            if handle:
+                                handle.cancel()
+                            flush(agent_name)
+                            
+                            # Add feedback buttons once per agent, outside the read loop
+                            bit = self._AGENT_BIT.get(agent_name, 0)
+                            if not self._completed_mask & bit:
+                                self._completed_mask |= bit
+                                loop.call_soon(
+                                    self._add_feedback_row, agent_name, feedback_rows[agent_name]
+                                )
+                    
+                    # Check if workflow is complete
+                    if agent_name == 'Workflow' and is_complete:
+                        with self.chat_container:
+                            with ui.card().classes('w-full mb-4 p-4 bg-blue-50 border border-blue-200'):
+                                ui.label('✅ Analysis Complete').classes('font-semibold text-lg text-blue-800 mb-2')
+                                ui.label('Please provide feedback on the agent responses above to help improve future analyses.').classes('text-blue-700')
+                        break
+                
+                # Render anything still pending, visible or not
+                for name, handle in flush_handles.items():
+                    handle.cancel()
+                    hidden_updates.add(name)
+                flush_handles.clear()
+                render_hidden_updates()
+                self._on_page_visible = None
         
         except Exception as ex:
             ui.notify(f'Streaming error: {str(ex)}', type='negative')
     
+    def _add_feedback_row(self, agent_name: str, row: ui.row) -> None:
+        """Fill the placeholder row below an agent response with feedback buttons."""
+        row.classes('mt-2 mb-4')
+        with row:
+            ui.label('Was this helpful?').classes('text-sm text-gray-600 self-center')
+            
+            thumbs_up_btn = ui.button(
+                '👍', 
+                on_click=functools.partial(self.submit_feedback, agent_name, True)
+            ).classes(self._BTN_UP_CLASSES)
+            
+            thumbs_down_btn = ui.button(
+                '👎', 
+                on_click=functools.partial(self.submit_feedback, agent_name, False)
+            ).classes(self._BTN_DOWN_CLASSES)
+        
+        # Store button references for state updates
+        self.feedback_buttons[agent_name] = {
+            'up': thumbs_up_btn,
+            'down': thumbs_down_btn
+        }
+    
     async def add_feedback_buttons(self, agent_name: str, message_element):
         """Add thumbs up/down feedback buttons to agent response."""
         try:
@@ -331,49 +550,74 @@ class ResumeRoastUI:
         except Exception as ex:
             ui.notify(f'❌ Error: {str(ex)}', type='negative')
     
+    def _handle_visibility_change(self, e) -> None:
+        """Track tab visibility and catch up on skipped renders when shown."""
+        self.page_visible = bool(e.args)
+        if self.page_visible and self._on_page_visible:
+            self._on_page_visible()
+    
     def create_main_interface(self):
         """Create the main chat interface."""
-        with ui.column().classes('w-full max-w-4xl mx-auto p-4 gap-4'):
+        # Skip markdown renders while the browser tab is hidden
+        ui.add_head_html(
+            '<script>document.addEventListener("visibilitychange", '
+            '() => emitEvent("visibility_change", !document.hidden));</script>'
+        )
+        ui.on('visibility_change', self._handle_visibility_change)
+        
+        with ui.column().classes('w-full max-w-4xl mx-auto p-4 gap-4') as main_column:
+            self._build_upload_section()
+        
+        # Build the chat panel after the upload form has been sent
+        def build_chat_section() -> None:
+            with main_column:
+                self._build_chat_section()
+        
+        ui.timer(0.05, build_chat_section, once=True)
+    
+    def _build_upload_section(self) -> None:
+        """Create the instructions and upload form."""
+        # Instructions
+        with ui.card().classes('w-full p-4'):
+            ui.label('Welcome to Resume Roast! 🔥').classes('text-xl font-bold mb-2')
+            ui.label(
+                'Upload your resume and paste a job description below. '
+                'Our AI agents will provide detailed feedback in real-time.'
+            ).classes('text-gray-600')
+        
+        # Upload area
+        with ui.card().classes('w-full p-4'):
+            ui.label('Step 1: Enter Job Description').classes('font-bold mb-2')
+            self.job_description_input = ui.textarea(
+                'Paste the job description here...',
+                placeholder='Looking for a Senior Python Developer with 5+ years of experience...'
+            ).classes('w-full').props('rows=4')
             
-            # Instructions
-            with ui.card().classes('w-full p-4'):
-                ui.label('Welcome to Resume Roast! 🔥').classes('text-xl font-bold mb-2')
-                ui.label(
-                    'Upload your resume and paste a job description below. '
-                    'Our AI agents will provide detailed feedback in real-time.'
-                ).classes('text-gray-600')
+            ui.separator().classes('my-4')
             
-            # Upload area
-            with ui.card().classes('w-full p-4'):
-                ui.label('Step 1: Enter Job Description').classes('font-bold mb-2')
-                self.job_description_input = ui.textarea(
-                    'Paste the job description here...',
-                    placeholder='Looking for a Senior Python Developer with 5+ years of experience...'
-                ).classes('w-full').props('rows=4')
-                
-                ui.separator().classes('my-4')
-                
-                ui.label('Step 2: Upload Resume (PDF only)').classes('font-bold mb-2')
-                self.upload_area = ui.upload(
-                    on_upload=self.handle_file_upload,
-                    auto_upload=True
-                ).classes('w-full').props('accept=.pdf max-file-size=5242880')  # 5MB limit
+            ui.label('Step 2: Upload Resume (PDF only)').classes('font-bold mb-2')
+            self.upload_area = ui.upload(
+                on_upload=self.handle_file_upload,
+                auto_upload=True
+            ).classes('w-full').props('accept=.pdf max-file-size=5242880')  # 5MB limit
+    
+    def _build_chat_section(self) -> None:
+        """Create the chat container with its welcome message."""
+        with ui.card().classes('w-full p-4 min-h-96'):
+            ui.label('AI Analysis').classes('font-bold mb-4')
+            self.chat_container = ui.column().classes('w-full gap-2')
             
-            # Chat container
-            with ui.card().classes('w-full p-4 min-h-96'):
-                ui.label('AI Analysis').classes('font-bold mb-4')
-                self.chat_container = ui.column().classes('w-full gap-2')
-                
-                # Initial welcome message
-                with self.chat_container:
-                    ui.chat_message(
-                        'Ready to analyze your resume. Please upload a PDF and provide a job description above.',
-                        name='Resume Roast AI',
-                        sent=False
-                    ).classes('mb-2')
+            # Initial welcome message
+            with self.chat_container:
+                ui.chat_message(
+                    'Ready to analyze your resume. Please upload a PDF and provide a job description above.',
+                    name='Resume Roast AI',
+                    sent=False
+                ).classes('mb-2')
     
     def run_app(self):
         """Run the NiceGUI application."""
+        app.on_shutdown(self.close)
         self.setup_theme()
         
         # Create feedback dialog at page level
@@ -399,7 +643,10 @@ def main():
         host='0.0.0.0',
         port=8080,
         reload=False,
-        show=False
+        show=False,
+        reconnect_timeout=3.0,
+        # The UI has no bind_* links, so skip the 10 Hz binding refresh loop
+        binding_refresh_interval=None,
     )
 
 
@@ -1,6 +1,7 @@
 """Advocate agent for highlighting resume strengths."""
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import ClassVar, List, Optional, Tuple
 
 
 class AdvocateAgent:
@@ -10,6 +11,16 @@ class AdvocateAgent:
     strengths, achievements, and potential value to employers.
     """
     
+    _BASE_PROMPT: ClassVar[str] = """You are the Advocate - an enthusiastic career coach. Highlight this candidate's top 3 strengths.
+
+Focus on:
+- Unique achievements and skills
+- Transferable experience  
+- Growth potential
+
+Be encouraging and specific. Keep response under 150 words.
+End with why they'd be a great fit for the role."""
+    
     def __init__(self) -> None:
         """Initialize the Advocate agent."""
         self.name = "Advocate"
@@ -25,21 +36,17 @@ class AdvocateAgent:
         Returns:
             System prompt string
         """
-        base_prompt = """You are the Advocate - an enthusiastic career coach. Highlight this candidate's top 3 strengths.
-
-Focus on:
-- Unique achievements and skills
-- Transferable experience  
-- Growth potential
-
-Be encouraging and specific. Keep response under 150 words.
-End with why they'd be a great fit for the role."""
-        
+        return self._assemble(tuple(memory_context) if memory_context else ())
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _assemble(cls, memory_context: Tuple[str, ...]) -> str:
+        """Build the system prompt for a given memory context."""
         if memory_context:
             memory_section = "\n\nBased on previous feedback patterns:\n" + "\n".join(memory_context)
-            return base_prompt + memory_section
+            return cls._BASE_PROMPT + memory_section
         
-        return base_prompt
+        return cls._BASE_PROMPT
     
     def format_user_message(self, resume_text: str, job_description: str) -> str:
         """
@@ -55,16 +62,17 @@ End with why they'd be a great fit for the role."""
         Raises:
             ValueError: If inputs are empty
         """
-        if not resume_text or not resume_text.strip():
+        if not resume_text or resume_text.isspace():
             raise ValueError("Resume text cannot be empty")
-        if not job_description or not job_description.strip():
+        if not job_description or job_description.isspace():
             raise ValueError("Job description cannot be empty")
-        return f"""
-JOB DESCRIPTION:
-{job_description}
-
-RESUME TO ADVOCATE FOR:
-{resume_text}
-
-Identify and highlight all the strengths, achievements, and positive aspects that make this candidate attractive for this role.
-"""
\ No newline at end of file
+        return self.format_validated_user_message(resume_text, job_description)
+    
+    @staticmethod
+    def format_validated_user_message(resume_text: str, job_description: str) -> str:
+        """Format the user message for inputs the caller has already checked are non-empty."""
+        return "".join((
+            "\nJOB DESCRIPTION:\n", job_description,
+            "\n\nRESUME TO ADVOCATE FOR:\n", resume_text,
+            "\n\nIdentify and highlight all the strengths, achievements, and positive aspects that make this candidate attractive for this role.\n",
+        ))
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Critic agent for harsh but constructive resume critique."""
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import ClassVar, List, Optional, Tuple
 
 
 class CriticAgent:
@@ -10,6 +11,17 @@ class CriticAgent:
     in a resume that could prevent it from being effective.
     """
     
+    _BASE_PROMPT: ClassVar[str] = """You are the Critic. Identify ONLY the top 3 critical resume issues.
+
+Be direct and specific. Maximum 100 words total.
+
+Format:
+1. [Issue] - [Why it matters] - [Quick fix]
+2. [Issue] - [Why it matters] - [Quick fix] 
+3. [Issue] - [Why it matters] - [Quick fix]
+
+Focus on: Missing keywords, weak language, experience gaps."""
+    
     def __init__(self) -> None:
         """Initialize the Critic agent."""
         self.name = "Critic"
@@ -25,22 +37,17 @@ class CriticAgent:
         Returns:
             System prompt string
         """
-        base_prompt = """You are the Critic. Identify ONLY the top 3 critical resume issues.
-
-Be direct and specific. Maximum 100 words total.
-
-Format:
-1. [Issue] - [Why it matters] - [Quick fix]
-2. [Issue] - [Why it matters] - [Quick fix] 
-3. [Issue] - [Why it matters] - [Quick fix]
-
-Focus on: Missing keywords, weak language, experience gaps."""
-        
+        return self._assemble(tuple(memory_context) if memory_context else ())
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _assemble(cls, memory_context: Tuple[str, ...]) -> str:
+        """Build the system prompt for a given memory context."""
         if memory_context:
             memory_section = "\n\nBased on previous feedback patterns:\n" + "\n".join(memory_context)
-            return base_prompt + memory_section
+            return cls._BASE_PROMPT + memory_section
         
-        return base_prompt
+        return cls._BASE_PROMPT
     
     def format_user_message(self, resume_text: str, job_description: str) -> str:
         """
@@ -56,16 +63,17 @@ Focus on: Missing keywords, weak language, experience gaps."""
         Raises:
             ValueError: If inputs are empty
         """
-        if not resume_text or not resume_text.strip():
+        if not resume_text or resume_text.isspace():
             raise ValueError("Resume text cannot be empty")
-        if not job_description or not job_description.strip():
+        if not job_description or job_description.isspace():
             raise ValueError("Job description cannot be empty")
-        return f"""
-JOB DESCRIPTION:
-{job_description}
-
-RESUME TO CRITIQUE:
-{resume_text}
-
-Provide your critical analysis focusing on what would prevent this resume from succeeding for this specific role.
-"""
\ No newline at end of file
+        return self.format_validated_user_message(resume_text, job_description)
+    
+    @staticmethod
+    def format_validated_user_message(resume_text: str, job_description: str) -> str:
+        """Format the user message for inputs the caller has already checked are non-empty."""
+        return "".join((
+            "\nJOB DESCRIPTION:\n", job_description,
+            "\n\nRESUME TO CRITIQUE:\n", resume_text,
+            "\n\nProvide your critical analysis focusing on what would prevent this resume from succeeding for this specific role.\n",
+        ))
\ No newline at end of file
@@ -1,11 +1,12 @@
-"""Multi-agent workflow orchestration using LangGraph."""
+"""Multi-agent workflow orchestration."""
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Dict, List
-
-from langgraph.graph import END, StateGraph
-from typing_extensions import TypedDict
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from services import LLMService
 
@@ -15,16 +16,43 @@ from .realist import RealistAgent
 
 logger = logging.getLogger(__name__)
 
+# Budgets for the memory block sent with every agent prompt
+MEMORY_ENTRY_MAX_CHARS = 200
+MEMORY_MAX_CHARS = 2000
 
-class AgentState(TypedDict):
-    """State shared between agents in the workflow."""
-    resume_text: str
-    job_description: str
-    critic_response: str
-    advocate_response: str
-    realist_response: str
-    memory_context: List[str]
-    current_agent: str
+
+def compress_memory_context(memory_context: Sequence[str]) -> List[str]:
+    """
+    Shrink aggregated learnings before they are injected into prompts.
+    
+    Entries are whitespace-normalized, de-duplicated case-insensitively,
+    truncated to MEMORY_ENTRY_MAX_CHARS and kept in order until the
+    MEMORY_MAX_CHARS budget is spent.
+    
+    Args:
+        memory_context: Aggregated learnings, most relevant first
+        
+    Returns:
+        Compressed list of learnings
+    """
+    compressed: List[str] = []
+    seen = set()
+    budget = MEMORY_MAX_CHARS
+    for entry in memory_context:
+        text = " ".join(entry.split())
+        key = text.lower()
+        if not text or key in seen:
+            continue
+        seen.add(key)
+        
+        if len(text) > MEMORY_ENTRY_MAX_CHARS:
+            text = text[:MEMORY_ENTRY_MAX_CHARS - 3].rstrip() + "..."
+        if len(text) > budget:
+            break
+        budget -= len(text) + 1  # Joined with newlines downstream
+        compressed.append(text)
+    
+    return compressed
 
 
 @dataclass
@@ -43,8 +71,19 @@ class AgentOrchestrator:
     to provide comprehensive resume feedback.
     """
     
-    def __init__(self, llm_service: LLMService) -> None:
-        """Initialize the orchestrator with required services."""
+    def __init__(
+        self,
+        llm_service: LLMService,
+        cache_ttl_seconds: float = 3600.0,
+        cache_max_entries: int = 128
+    ) -> None:
+        """Initialize the orchestrator with required services.
+        
+        Args:
+            llm_service: Service used to stream agent responses
+            cache_ttl_seconds: How long completed debates are replayed from cache
+            cache_max_entries: Maximum number of cached debates (0 disables caching)
+        """
         if not llm_service:
             raise ValueError("LLM service is required")
             
@@ -52,82 +91,116 @@ class AgentOrchestrator:
         self.critic = CriticAgent()
         self.advocate = AdvocateAgent()
         self.realist = RealistAgent()
-        self.workflow = self._create_workflow()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self._result_cache: "OrderedDict[str, Tuple[float, AgentWorkflowResult]]" = OrderedDict()
     
-    def _create_workflow(self) -> StateGraph:
-        """Create the LangGraph workflow for agent orchestration."""
-        
-        async def critic_node(state: AgentState) -> AgentState:
-            """Execute critic agent and update state."""
-            prompt = self.critic.get_system_prompt(state["memory_context"])
-            message = self.critic.format_user_message(
-                state["resume_text"], 
-                state["job_description"]
-            )
-            
-            response = await self.llm_service.generate_complete_response(
-                prompt, message, state["memory_context"]
-            )
-            
-            state["critic_response"] = response
-            state["current_agent"] = "Critic"
-            return state
-        
-        async def advocate_node(state: AgentState) -> AgentState:
-            """Execute advocate agent and update state."""
-            prompt = self.advocate.get_system_prompt(state["memory_context"])
-            message = self.advocate.format_user_message(
-                state["resume_text"], 
-                state["job_description"]
-            )
-            
-            response = await self.llm_service.generate_complete_response(
-                prompt, message, state["memory_context"]
-            )
-            
-            state["advocate_response"] = response
-            state["current_agent"] = "Advocate"
-            return state
-        
-        async def realist_node(state: AgentState) -> AgentState:
-            """Execute realist agent and update state."""
-            prompt = self.realist.get_system_prompt(state["memory_context"])
-            message = self.realist.format_user_message(
-                state["resume_text"], 
-                state["job_description"],
-                state["critic_response"],
-                state["advocate_response"]
-            )
-            
-            response = await self.llm_service.generate_complete_response(
-                prompt, message, state["memory_context"]
-            )
-            
-            state["realist_response"] = response
-            state["current_agent"] = "Realist"
-            return state
+    @staticmethod
+    def _cache_key(resume_text: str, job_description: str, memory_context: List[str]) -> str:
+        """Hash the debate inputs into a result cache key."""
+        digest = hashlib.sha256()
+        for part in (resume_text, job_description, *memory_context):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _get_cached_result(self, key: str) -> Optional[AgentWorkflowResult]:
+        """Return a cached debate result if present and not expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
         
-        # Create workflow
-        workflow = StateGraph(AgentState)
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self._result_cache[key]
+            return None
         
-        # Add nodes
-        workflow.add_node("critic", critic_node)
-        workflow.add_node("advocate", advocate_node)
-        workflow.add_node("realist", realist_node)
+        self._result_cache.move_to_end(key)
+        return result
+    
+    def _store_result(self, key: str, result: AgentWorkflowResult) -> None:
+        """Cache a completed debate result, evicting the oldest entries."""
+        if self.cache_max_entries <= 0:
+            return
         
-        # Define edges
-        workflow.set_entry_point("critic")
-        workflow.add_edge("critic", "advocate")
-        workflow.add_edge("advocate", "realist")
-        workflow.add_edge("realist", END)
+        self._result_cache[key] = (time.monotonic(), result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.cache_max_entries:
+            self._result_cache.popitem(last=False)
+    
+    @staticmethod
+    def _replay_result(result: AgentWorkflowResult) -> Iterator[Dict[str, Any]]:
+        """Yield the same frame sequence as a live debate from a cached result."""
+        responses = (
+            ("Critic", 1, result.critic_response),
+            ("Advocate", 2, result.advocate_response),
+            ("Realist", 3, result.realist_response),
+        )
+        for agent_name, order, response in responses:
+            yield {"agent_name": agent_name, "chunk": "", "is_complete": False, "order": order}
+            yield {"agent_name": agent_name, "chunk": response, "is_complete": False, "order": order}
+            yield {"agent_name": agent_name, "chunk": "", "is_complete": True, "order": order}
         
-        return workflow.compile()
+        yield {
+            "agent_name": "Workflow", 
+            "chunk": "", 
+            "is_complete": True, 
+            "order": 4,
+            "results": result
+        }
+    
+    async def _stream_agent(
+        self,
+        queue: asyncio.Queue,
+        agent_name: str,
+        order: int,
+        system_prompt: str,
+        user_message: str,
+        memory_context: List[str]
+    ) -> str:
+        """
+        Stream one agent's response into a shared queue.
+        
+        Each chunk is pushed as a response frame, followed by the agent's
+        completion frame. Failures are pushed as the exception itself so
+        the consumer can re-raise them.
+        
+        Args:
+            queue: Queue shared with the consuming generator
+            agent_name: Name of the agent being executed
+            order: Display order of the agent
+            system_prompt: System prompt for the agent
+            user_message: Formatted user message for the agent
+            memory_context: Aggregated learnings from previous sessions
+            
+        Returns:
+            The complete agent response
+        """
+        chunks: List[str] = []
+        try:
+            async for chunk in self.llm_service.generate_agent_response(
+                system_prompt, user_message, agent_name, memory_context
+            ):
+                chunks.append(chunk)
+                queue.put_nowait({
+                    "agent_name": agent_name, 
+                    "chunk": chunk, 
+                    "is_complete": False, 
+                    "order": order
+                })
+        except Exception as e:
+            logger.error("%s agent failed: %s", agent_name, e)
+            queue.put_nowait(e)
+            return ""
+        
+        queue.put_nowait({"agent_name": agent_name, "chunk": "", "is_complete": True, "order": order})
+        return "".join(chunks)
     
     async def execute_debate(
         self, 
         resume_text: str, 
         job_description: str,
-        memory_context: List[str] = None
+        memory_context: Optional[Sequence[str]] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Execute the multi-agent debate workflow with streaming responses.
@@ -139,60 +212,66 @@ class AgentOrchestrator:
             
         Yields:
             Dictionary containing agent name, response chunk, and metadata
+            
+        Raises:
+            ValueError: If resume text or job description is empty
         """
-        if memory_context is None:
-            memory_context = []
-        
-        # Initialize state
-        initial_state: AgentState = {
-            "resume_text": resume_text,
-            "job_description": job_description,
-            "critic_response": "",
-            "advocate_response": "",
-            "realist_response": "",
-            "memory_context": memory_context,
-            "current_agent": "",
-        }
+        # Validate once; Critic and Advocate format their messages unchecked
+        if not resume_text or resume_text.isspace():
+            raise ValueError("Resume text cannot be empty")
+        if not job_description or job_description.isspace():
+            raise ValueError("Job description cannot be empty")
         
-        # Execute Critic
-        yield {"agent_name": "Critic", "chunk": "", "is_complete": False, "order": 1}
-        
-        critic_prompt = self.critic.get_system_prompt(memory_context)
-        critic_message = self.critic.format_user_message(resume_text, job_description)
-        critic_response = ""
-        
-        async for chunk in self.llm_service.generate_agent_response(
-            critic_prompt, critic_message, "Critic", memory_context
-        ):
-            critic_response += chunk
-            yield {
-                "agent_name": "Critic", 
-                "chunk": chunk, 
-                "is_complete": False, 
-                "order": 1
-            }
+        # Compress once; the same block goes to all three agents
+        memory_context = compress_memory_context(memory_context or [])
         
-        yield {"agent_name": "Critic", "chunk": "", "is_complete": True, "order": 1}
+        # Identical inputs produce a replay of the previous debate
+        cache_key = self._cache_key(resume_text, job_description, memory_context)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("Replaying cached debate result")
+            for frame in self._replay_result(cached):
+                yield frame
+            return
         
-        # Execute Advocate
+        # Critic and Advocate are independent, so stream them concurrently
+        yield {"agent_name": "Critic", "chunk": "", "is_complete": False, "order": 1}
         yield {"agent_name": "Advocate", "chunk": "", "is_complete": False, "order": 2}
         
-        advocate_prompt = self.advocate.get_system_prompt(memory_context)
-        advocate_message = self.advocate.format_user_message(resume_text, job_description)
-        advocate_response = ""
+        queue: asyncio.Queue = asyncio.Queue()
+        critic_task = asyncio.create_task(self._stream_agent(
+            queue,
+            "Critic",
+            1,
+            self.critic.get_system_prompt(memory_context),
+            self.critic.format_validated_user_message(resume_text, job_description),
+            memory_context
+        ))
+        advocate_task = asyncio.create_task(self._stream_agent(
+            queue,
+            "Advocate",
+            2,
+            self.advocate.get_system_prompt(memory_context),
+            self.advocate.format_validated_user_message(resume_text, job_description),
+            memory_context
+        ))
+        tasks = (critic_task, advocate_task)
         
-        async for chunk in self.llm_service.generate_agent_response(
-            advocate_prompt, advocate_message, "Advocate", memory_context
-        ):
-            advocate_response += chunk
-            yield {
-                "agent_name": "Advocate", 
-                "chunk": chunk, 
-                "is_complete": False, 
-                "order": 2
-            }
-        
-        yield {"agent_name": "Advocate", "chunk": "", "is_complete": True, "order": 2}
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                if item["is_complete"]:
+                    remaining -= 1
+                yield item
+            
+            critic_response = await critic_task
+            advocate_response = await advocate_task
+        finally:
+            for task in tasks:
+                task.cancel()
         
         # Execute Realist
         yield {"agent_name": "Realist", "chunk": "", "is_complete": False, "order": 3}
@@ -201,12 +280,12 @@ class AgentOrchestrator:
         realist_message = self.realist.format_user_message(
             resume_text, job_description, critic_response, advocate_response
         )
-        realist_response = ""
+        realist_chunks: List[str] = []
         
         async for chunk in self.llm_service.generate_agent_response(
             realist_prompt, realist_message, "Realist", memory_context
         ):
-            realist_response += chunk
+            realist_chunks.append(chunk)
             yield {
                 "agent_name": "Realist", 
                 "chunk": chunk, 
@@ -215,6 +294,12 @@ class AgentOrchestrator:
             }
         
         yield {"agent_name": "Realist", "chunk": "", "is_complete": True, "order": 3}
+        result = AgentWorkflowResult(
+            critic_response=critic_response,
+            advocate_response=advocate_response,
+            realist_response="".join(realist_chunks)
+        )
+        self._store_result(cache_key, result)
         
         # Final workflow complete signal
         yield {
@@ -222,9 +307,5 @@ class AgentOrchestrator:
             "chunk": "", 
             "is_complete": True, 
             "order": 4,
-            "results": AgentWorkflowResult(
-                critic_response=critic_response,
-                advocate_response=advocate_response,
-                realist_response=realist_response
-            )
+            "results": result
         }
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Realist agent for balanced resume assessment."""
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import ClassVar, List, Optional, Tuple
 
 
 class RealistAgent:
@@ -10,6 +11,16 @@ class RealistAgent:
     to provide practical, balanced recommendations for improvement.
     """
     
+    _BASE_PROMPT: ClassVar[str] = """You are the Realist - a pragmatic hiring manager. Provide 3 specific, actionable recommendations.
+
+Balance the Critic's concerns with the Advocate's strengths:
+- Prioritize high-impact changes
+- Give practical next steps
+- Consider market realities
+
+Keep response under 150 words.
+End with one key positioning strategy for this role."""
+    
     def __init__(self) -> None:
         """Initialize the Realist agent."""
         self.name = "Realist"
@@ -25,21 +36,17 @@ class RealistAgent:
         Returns:
             System prompt string
         """
-        base_prompt = """You are the Realist - a pragmatic hiring manager. Provide 3 specific, actionable recommendations.
-
-Balance the Critic's concerns with the Advocate's strengths:
-- Prioritize high-impact changes
-- Give practical next steps
-- Consider market realities
-
-Keep response under 150 words.
-End with one key positioning strategy for this role."""
-        
+        return self._assemble(tuple(memory_context) if memory_context else ())
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _assemble(cls, memory_context: Tuple[str, ...]) -> str:
+        """Build the system prompt for a given memory context."""
         if memory_context:
             memory_section = "\n\nBased on previous feedback patterns:\n" + "\n".join(memory_context)
-            return base_prompt + memory_section
+            return cls._BASE_PROMPT + memory_section
         
-        return base_prompt
+        return cls._BASE_PROMPT
     
     def format_user_message(self, resume_text: str, job_description: str, critic_response: str, advocate_response: str) -> str:
         """
@@ -57,27 +64,31 @@ End with one key positioning strategy for this role."""
         Raises:
             ValueError: If any input is empty
         """
-        if not resume_text or not resume_text.strip():
+        if not resume_text or resume_text.isspace():
             raise ValueError("Resume text cannot be empty")
-        if not job_description or not job_description.strip():
+        if not job_description or job_description.isspace():
             raise ValueError("Job description cannot be empty")
-        if not critic_response or not critic_response.strip():
+        if not critic_response or critic_response.isspace():
             raise ValueError("Critic response cannot be empty")
-        if not advocate_response or not advocate_response.strip():
+        if not advocate_response or advocate_response.isspace():
             raise ValueError("Advocate response cannot be empty")
-            
-        return f"""
-JOB DESCRIPTION:
-{job_description}
-
-RESUME:
-{resume_text}
-
-CRITIC'S ANALYSIS:
-{critic_response}
-
-ADVOCATE'S PERSPECTIVE:
-{advocate_response}
-
-Now provide your balanced, realistic assessment with specific actionable recommendations.
-"""
\ No newline at end of file
+        
+        return self.format_validated_user_message(
+            resume_text, job_description, critic_response, advocate_response
+        )
+    
+    @staticmethod
+    def format_validated_user_message(
+        resume_text: str,
+        job_description: str,
+        critic_response: str,
+        advocate_response: str
+    ) -> str:
+        """Format the user message for inputs the caller has already checked are non-empty."""
+        return "".join((
+            "\nJOB DESCRIPTION:\n", job_description,
+            "\n\nRESUME:\n", resume_text,
+            "\n\nCRITIC'S ANALYSIS:\n", critic_response,
+            "\n\nADVOCATE'S PERSPECTIVE:\n", advocate_response,
+            "\n\nNow provide your balanced, realistic assessment with specific actionable recommendations.\n",
+        ))
\ No newline at end of file
@@ -6,6 +6,7 @@ from .dependencies import (
     get_feedback_repository,
     get_pdf_service,
     get_s3_service,
+    get_llm_service,
     get_agent_orchestrator,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "get_feedback_repository",
     "get_pdf_service",
     "get_s3_service",
+    "get_llm_service",
     "get_agent_orchestrator",
 ]
\ No newline at end of file
@@ -1,9 +1,12 @@
 """FastAPI route dependencies."""
 
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agents import AgentOrchestrator
+from config import get_settings
 from database import get_db
 from repositories import FeedbackRepository, ResumeRepository
 from services import LLMService, PDFService, S3Service
@@ -23,23 +26,35 @@ def get_feedback_repository(
     return FeedbackRepository(db)
 
 
+@lru_cache()
 def get_pdf_service() -> PDFService:
-    """Get PDF service instance."""
+    """Get cached PDF service instance."""
     return PDFService()
 
 
+@lru_cache()
 def get_s3_service() -> S3Service:
-    """Get S3 service instance."""
+    """Get cached S3 service instance."""
     return S3Service()
 
 
+@lru_cache()
 def get_llm_service() -> LLMService:
-    """Get LLM service instance."""
+    """Get cached LLM service instance."""
     return LLMService()
 
 
+@lru_cache()
 def get_agent_orchestrator(
     llm_service: LLMService = Depends(get_llm_service)
 ) -> AgentOrchestrator:
-    """Get agent orchestrator instance."""
-    return AgentOrchestrator(llm_service)
\ No newline at end of file
+    """Get cached agent orchestrator instance.
+    
+    Keyed on the (cached) LLM service, so the agents are built
+    once per process.
+    """
+    settings = get_settings()
+    return AgentOrchestrator(
+        llm_service,
+        cache_ttl_seconds=settings.memory_refresh_interval_hours * 3600
+    )
\ No newline at end of file
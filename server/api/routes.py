@@ -1,13 +1,15 @@
 """FastAPI routes for Resume Roast application."""
 
-import json
 import logging
+from collections import defaultdict
 from datetime import datetime, UTC
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+import anyio
+import orjson
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, UploadFile
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.schemas import (
@@ -16,6 +18,8 @@ from core.schemas import (
     FeedbackSessionSchema,
     AgentFeedbackRequest,
     AgentStreamResponse,
+    FEEDBACK_SESSION_ADAPTER,
+    RESUME_ADAPTER,
 )
 from database import get_db
 from repositories import ResumeRepository, FeedbackRepository
@@ -30,6 +34,34 @@ from .dependencies import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Compact newline-delimited stream format negotiated via the Accept header.
+# Delta frames are "D\t<agent_name>\t<chunk>", everything else is "J<json>".
+COMPACT_STREAM_MEDIA_TYPE = "application/x-ndjson+rr"
+
+
+def format_compact_frame(response_data: Dict[str, Any]) -> str:
+    """
+    Encode a stream event as a compact frame.
+    
+    Plain text deltas skip JSON encoding entirely; control events and
+    chunks containing line breaks fall back to a JSON frame.
+    
+    Args:
+        response_data: Event yielded by the agent orchestrator
+        
+    Returns:
+        Newline-terminated frame string
+    """
+    chunk = response_data.get("chunk")
+    if (
+        chunk
+        and not response_data.get("is_complete")
+        and "\n" not in chunk
+        and "\r" not in chunk
+    ):
+        return f"D\t{response_data['agent_name']}\t{chunk}\n"
+    return f"J{orjson.dumps(response_data, default=str).decode()}\n"
+
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check():
@@ -75,18 +107,16 @@ async def upload_resume(
         # Validate job description
         pdf_service.validate_job_description(job_description)
         
-        # Read and parse PDF
-        pdf_content = await file.read()
-        if not pdf_content:
+        # The spooled upload is consumed in place instead of read into memory
+        if not file.size:
             raise HTTPException(
                 status_code=400,
                 detail="Uploaded file is empty. Please upload a valid PDF."
             )
         
-        pdf_data = await pdf_service.extract_text_from_pdf(pdf_content)
-        
-        # Upload to S3
-        s3_url = await s3_service.upload_pdf(pdf_content, file.filename)
+        # Parse before uploading so PDFs that fail validation never reach S3
+        pdf_data = await pdf_service.extract_text_from_pdf_stream(file.file)
+        s3_url = await s3_service.upload_pdf_stream(file.file, file.filename)
         
         # Create resume record
         resume = await resume_repo.create_resume(
@@ -142,10 +172,12 @@ async def stream_analysis(
     session_id: UUID,
     db: AsyncSession = Depends(get_db),
     agent_orchestrator: AgentOrchestrator = Depends(get_agent_orchestrator),
+    accept: Optional[str] = Header(None),
 ) -> StreamingResponse:
     """
     Stream agent analysis responses for a given session.
-    Returns Server-Sent Events with agent responses.
+    Returns Server-Sent Events with agent responses, or compact frames
+    when the client accepts COMPACT_STREAM_MEDIA_TYPE.
     """
     import main as main_module
     try:
@@ -158,12 +190,12 @@ async def stream_analysis(
         if not feedback_session:
             raise HTTPException(status_code=404, detail="Feedback session not found")
 
-        resume = await resume_repo.get_resume_by_id(feedback_session.resume_id)
+        resume = await resume_repo.get_resume_content_by_id(feedback_session.resume_id)
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
         # Use global agent memory patterns refreshed periodically
-        memory_context = main_module.AGENT_MEMORY if hasattr(main_module, 'AGENT_MEMORY') else []
+        memory_context = main_module.AGENT_MEMORY if hasattr(main_module, 'AGENT_MEMORY') else ()
         
         # Log agent memory context - essential for system monitoring
         logger.info(
@@ -174,38 +206,46 @@ async def stream_analysis(
         for i, context in enumerate(memory_context[:3]):  # Show first 3 patterns
             logger.info("  Pattern %d: %s", i + 1, context)
         
-        async def generate_stream() -> AsyncGenerator[str, None]:
+        compact = bool(accept) and COMPACT_STREAM_MEDIA_TYPE in accept
+        
+        async def generate_stream() -> AsyncGenerator[Union[str, bytes], None]:
             """Generate Server-Sent Events stream."""
+            agent_responses: Dict[str, List[str]] = defaultdict(list)
+            completed_orders: Dict[str, int] = {}
+            
+            async def save_completed_responses() -> None:
+                """Persist completed agent responses that are not saved yet."""
+                rows = [
+                    (agent_name.lower(), "".join(agent_responses[agent_name]), order)
+                    for agent_name, order in completed_orders.items()
+                ]
+                completed_orders.clear()
+                await feedback_repo.add_agent_responses_bulk(session_id, rows)
+            
             try:
-                agent_responses = {}
-                
                 async for response_data in agent_orchestrator.execute_debate(
                     resume.text_content,
                     resume.job_description,
                     memory_context
                 ):
-                    # Store complete responses for database
+                    # Remember completed agents; rows are written after the stream
                     if response_data["is_complete"] and response_data["agent_name"] != "Workflow":
                         agent_name = response_data["agent_name"]
                         if agent_name in agent_responses:
-                            # Save to database
-                            await feedback_repo.add_agent_response(
-                                session_id=session_id,
-                                agent_name=agent_name,
-                                response_text=agent_responses[agent_name],
-                                order=response_data["order"]
-                            )
+                            completed_orders[agent_name] = response_data["order"]
                     
                     # Accumulate responses
                     if not response_data["is_complete"]:
-                        agent_name = response_data["agent_name"]
-                        if agent_name not in agent_responses:
-                            agent_responses[agent_name] = ""
-                        agent_responses[agent_name] += response_data["chunk"]
+                        agent_responses[response_data["agent_name"]].append(response_data["chunk"])
                     
                     # Stream to client
-                    event_data = json.dumps(response_data, default=str)
-                    yield f"data: {event_data}\n\n"
+                    if compact:
+                        yield format_compact_frame(response_data)
+                    else:
+                        yield b"data: " + orjson.dumps(response_data, default=str) + b"\n\n"
+                
+                # Save responses without stalling the stream between agents
+                await save_completed_responses()
                 
                 # Mark session as completed
                 await feedback_repo.complete_feedback_session(session_id)
@@ -215,11 +255,24 @@ async def stream_analysis(
                     "error": True,
                     "message": str(e)
                 }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                if compact:
+                    yield format_compact_frame(error_data)
+                else:
+                    yield b"data: " + orjson.dumps(error_data) + b"\n\n"
+            finally:
+                # Keep responses from the agents that did finish, also when the
+                # client disconnects (GeneratorExit / cancellation skip except)
+                if completed_orders:
+                    # Shielded: the cancelled request scope would abort the write
+                    with anyio.CancelScope(shield=True):
+                        try:
+                            await save_completed_responses()
+                        except Exception as save_error:
+                            logger.error("Failed to save agent responses: %s", str(save_error))
         
         return StreamingResponse(
             generate_stream(),
-            media_type="text/event-stream",
+            media_type=COMPACT_STREAM_MEDIA_TYPE if compact else "text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
@@ -307,29 +360,46 @@ async def submit_feedback(
 
 
 
-@router.get("/session/{session_id}", response_model=FeedbackSessionSchema)
+@router.get(
+    "/session/{session_id}",
+    response_model=None,
+    responses={200: {"model": FeedbackSessionSchema}},
+)
 async def get_session(
     session_id: UUID,
     db: AsyncSession = Depends(get_db),
-):
+) -> Response:
     """Get feedback session with all agent responses."""
     feedback_repo = FeedbackRepository(db)
     feedback_session = await feedback_repo.get_feedback_session_by_id(session_id)
     if not feedback_session:
         raise HTTPException(status_code=404, detail="Feedback session not found")
     
-    return feedback_session
+    # Validate and serialize once with the prebuilt adapter
+    return Response(
+        content=FEEDBACK_SESSION_ADAPTER.dump_json(
+            FEEDBACK_SESSION_ADAPTER.validate_python(feedback_session)
+        ),
+        media_type="application/json",
+    )
 
 
-@router.get("/resume/{resume_id}", response_model=ResumeSchema)
+@router.get(
+    "/resume/{resume_id}",
+    response_model=None,
+    responses={200: {"model": ResumeSchema}},
+)
 async def get_resume(
     resume_id: UUID,
     db: AsyncSession = Depends(get_db),
-):
+) -> Response:
     """Get resume with all feedback sessions."""
     resume_repo = ResumeRepository(db)
     resume = await resume_repo.get_resume_by_id(resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    return resume
\ No newline at end of file
+    return Response(
+        content=RESUME_ADAPTER.dump_json(RESUME_ADAPTER.validate_python(resume)),
+        media_type="application/json",
+    )
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     database_url: str = Field(description="PostgreSQL database URL")
     database_pool_size: int = Field(default=10, description="Database connection pool size")
     database_echo: bool = Field(default=False, description="Echo SQL queries")
+    database_statement_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="asyncpg prepared statement cache size (0 behind pgbouncer transaction pooling)"
+    )
     
     # Azure OpenAI
     azure_openai_api_key: str = Field(description="Azure OpenAI API key")
@@ -39,6 +44,29 @@ class Settings(BaseSettings):
         le=100000, 
         description="Max tokens for resume"
     )
+    openai_read_timeout: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Seconds to wait for each read from Azure OpenAI, including between stream chunks"
+    )
+    openai_max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description="Retries for failed Azure OpenAI requests"
+    )
+    stream_batch_chars: int = Field(
+        default=64,
+        ge=1,
+        description="Buffered characters that trigger a streamed chunk"
+    )
+    stream_batch_interval_s: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Max seconds a streamed delta waits in the batch buffer"
+    )
     job_description_token_limit: int = Field(
         default=5000, 
         ge=100, 
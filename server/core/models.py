@@ -1,32 +1,63 @@
 """SQLAlchemy models for the Resume Roast application."""
 
+import hashlib
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import CheckConstraint, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
 
 
+# Agent names are stored lowercase so lookups compare them directly
+_AGENT_NAME_CHECK = "agent_name IN ('critic', 'advocate', 'realist')"
+
+
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562), so new keys append to the right of each index."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+def _description_hash(context) -> bytes:
+    """SHA-256 of a learning's description, its fixed-size uniqueness key."""
+    return hashlib.sha256(context.get_current_parameters()["description"].encode()).digest()
+
+
+def _utcnow() -> datetime:
+    """Client-side timestamp default, known after flush without a refresh."""
+    return datetime.now(timezone.utc)
+
+
 class Resume(Base):
     """Resume model for storing uploaded resumes."""
     
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Uploads arrive in time order, so a tiny BRIN covers time-range scans
+        Index("ix_resumes_uploaded_at_brin", "uploaded_at", postgresql_using="brin"),
+    )
     
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4
+        default=_uuid7
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
-    text_content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Large text columns are deferred; only single-resume lookups undefer them
+    text_content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
     s3_url: Mapped[str] = mapped_column(String(500), nullable=False)
-    job_description: Mapped[str] = mapped_column(Text, nullable=False)
+    job_description: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        default=_utcnow,
         server_default=func.now()
     )
     
@@ -42,6 +73,24 @@ class Resume(Base):
         return f"<Resume(id={self.id}, filename='{self.filename}')>"
 
 
+# Single searchable document, so search_resumes_by_text probes one trigram
+# index instead of OR-ing three. Must match ix_resumes_search_trgm exactly.
+RESUME_SEARCH_DOCUMENT = (
+    Resume.filename
+    + literal_column("' '", String)
+    + Resume.job_description
+    + literal_column("' '", String)
+    + Resume.text_content
+)
+
+Index(
+    "ix_resumes_search_trgm",
+    RESUME_SEARCH_DOCUMENT.label("search_document"),
+    postgresql_using="gin",
+    postgresql_ops={"search_document": "gin_trgm_ops"},
+)
+
+
 class FeedbackSession(Base):
     """Feedback session model for tracking agent debates."""
     
@@ -50,7 +99,7 @@ class FeedbackSession(Base):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4
+        default=_uuid7
     )
     resume_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
@@ -65,6 +114,7 @@ class FeedbackSession(Base):
     )  # in_progress, completed, failed
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        default=_utcnow,
         server_default=func.now()
     )
     completed_at: Mapped[Optional[datetime]] = mapped_column(
@@ -90,28 +140,33 @@ class AgentResponse(Base):
     """Agent response model for storing individual agent critiques."""
     
     __tablename__ = "agent_responses"
+    __table_args__ = (
+        # Feedback lookups filter by session and agent; also serves session_id alone
+        Index("ix_agent_responses_session_agent", "session_id", "agent_name"),
+        CheckConstraint(_AGENT_NAME_CHECK, name="ck_agent_responses_agent_name"),
+    )
     
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4
+        default=_uuid7
     )
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("feedback_sessions.id"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     agent_name: Mapped[str] = mapped_column(
         String(50), 
         nullable=False
-    )  # critic, advocate, realist
+    )  # critic, advocate, realist (lowercase, enforced by CHECK)
     response_text: Mapped[str] = mapped_column(Text, nullable=False)
     order: Mapped[int] = mapped_column(Integer, nullable=False)
     thumbs_up: Mapped[Optional[bool]] = mapped_column(nullable=True)
     feedback_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        default=_utcnow,
         server_default=func.now()
     )
     
@@ -134,13 +189,18 @@ class AggregatedLearning(Base):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4
+        default=_uuid7
     )
     pattern_type: Mapped[str] = mapped_column(
         String(100), 
         nullable=False
     )  # positive_feedback, negative_feedback, skill_gap, etc.
     description: Mapped[str] = mapped_column(Text, nullable=False)
+    description_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
+        nullable=False,
+        default=_description_hash
+    )
     frequency: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     confidence_score: Mapped[float] = mapped_column(
         Float, 
@@ -150,9 +210,25 @@ class AggregatedLearning(Base):
     agent_name: Mapped[str] = mapped_column(String(50), nullable=False)
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        default=_utcnow,
         server_default=func.now(),
         onupdate=func.now()
     )
     
+    __table_args__ = (
+        # Conflict target of the create_or_update_learning upsert; keyed on
+        # the description's hash so the unique index stays small
+        UniqueConstraint("pattern_type", "agent_name", "description_hash", name="uq_learning_triplet"),
+        CheckConstraint(_AGENT_NAME_CHECK, name="ck_aggregated_learnings_agent_name"),
+        # Matches the get_aggregated_learnings ordering, so the top-N needs no sort
+        Index("ix_learning_rank", frequency.desc(), last_updated.desc()),
+        Index(
+            "ix_learning_last_updated_brin",
+            last_updated,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<AggregatedLearning(pattern_type='{self.pattern_type}', agent='{self.agent_name}')>"
\ No newline at end of file
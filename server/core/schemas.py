@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class ResumeUpload(BaseModel):
@@ -100,6 +100,12 @@ class AgentFeedbackRequest(BaseModel):
         description="Optional text feedback",
         max_length=500
     )
+    
+    @field_validator("agent_name")
+    @classmethod
+    def normalize_agent_name(cls, value: str) -> str:
+        """Store and query agent names in their canonical lowercase form."""
+        return value.lower()
 
 
 class HealthCheckResponse(BaseModel):
@@ -116,4 +122,10 @@ class AgentStreamResponse(BaseModel):
     agent_name: str
     chunk: str
     is_complete: bool = False
-    order: int
\ No newline at end of file
+    order: int
+
+
+# Built once at import time; converting ORM rows through these avoids
+# rebuilding validators for the nested resume/session/response tree per call.
+RESUME_ADAPTER = TypeAdapter(ResumeSchema)
+FEEDBACK_SESSION_ADAPTER = TypeAdapter(FeedbackSessionSchema)
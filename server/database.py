@@ -22,8 +22,17 @@ engine = create_async_engine(
     settings.database_url,
     pool_size=settings.database_pool_size,
     max_overflow=20,
-    pool_pre_ping=True,
+    # No per-checkout SELECT 1; recycle connections before idle timeouts can kill them
+    pool_pre_ping=False,
+    pool_recycle=1800,
     echo=settings.database_echo,
+    connect_args={
+        # Reuse server-side prepared statements so repeat queries skip Parse
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+        "server_settings": {"application_name": "resume_roast"},
+        "command_timeout": 30,
+    },
 )
 
 # Create session factory
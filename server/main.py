@@ -2,17 +2,26 @@
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from datetime import datetime
+from typing import AsyncGenerator, Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
-from api import router
+from fastapi.responses import ORJSONResponse
+
+from api import (
+    get_agent_orchestrator,
+    get_llm_service,
+    get_pdf_service,
+    get_s3_service,
+    router,
+)
 from config import get_settings
 from database import get_db_session
 from repositories import FeedbackRepository
+from services.llm_service import close_llm_client, load_token_encoding
 
 settings = get_settings()
 
@@ -29,22 +38,30 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler = AsyncIOScheduler()
 
-# Global agent memory for all analyses
-AGENT_MEMORY: list[str] = []
+# Global agent memory for all analyses; an immutable snapshot replaced on refresh
+AGENT_MEMORY: tuple[str, ...] = ()
+
+# Learnings watermark seen by the last refresh; unchanged means no reload
+_LAST_MEMORY_WATERMARK: Optional[Tuple[Optional[datetime], int, int]] = None
 
 
 async def refresh_agent_memory() -> None:
     """Background task to refresh agent memory with aggregated learnings."""
-    global AGENT_MEMORY
+    global AGENT_MEMORY, _LAST_MEMORY_WATERMARK
     try:
         async with get_db_session() as session:
             feedback_repo = FeedbackRepository(session)
             
-            # Get recent learnings
-            learnings = await feedback_repo.get_aggregated_learnings(limit=50)
+            # Cheap aggregate probe; skip the reload when nothing changed
+            watermark = await feedback_repo.get_learning_watermark()
+            if watermark == _LAST_MEMORY_WATERMARK:
+                logger.info("Memory refresh skipped: no new learnings")
+                return
             
-            # Extract descriptions and store in global memory
-            AGENT_MEMORY = [learning.description for learning in learnings]
+            # Load only the descriptions of recent learnings into global memory
+            descriptions = await feedback_repo.get_recent_learning_descriptions(limit=50)
+            AGENT_MEMORY = tuple(descriptions)
+            _LAST_MEMORY_WATERMARK = watermark
             
             logger.info(
                 "Memory refresh completed: Found %d learning patterns", 
@@ -59,6 +76,27 @@ async def refresh_agent_memory() -> None:
         logger.error("Error during memory refresh: %s", str(e))
 
 
+def prewarm_services() -> None:
+    """Build the cached route dependencies before the first request."""
+    try:
+        get_agent_orchestrator(get_llm_service())
+        get_pdf_service()
+        # Creating the boto3 client loads its service model, which is slow
+        _ = get_s3_service().client
+        logger.info("Services prewarmed")
+    except Exception as e:
+        logger.error("Error during service prewarm: %s", str(e))
+    
+    try:
+        # Token limit checks run on the event loop; never download the BPE file there
+        load_token_encoding(settings.azure_openai_deployment)
+    except Exception as e:
+        logger.error(
+            "Token encoding unavailable; pre-fetch it into TIKTOKEN_CACHE_DIR: %s",
+            str(e)
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan management."""
@@ -79,11 +117,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Run initial memory refresh
     await refresh_agent_memory()
     
+    prewarm_services()
+    
     yield
     
     # Shutdown
     # Application shutdown
     scheduler.shutdown()
+    await close_llm_client()
 
 
 # Create FastAPI app
@@ -91,7 +132,8 @@ app = FastAPI(
     title="Resume Roast",
     description="AI-powered resume critique platform with multi-agent debate system",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
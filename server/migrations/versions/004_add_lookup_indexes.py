@@ -0,0 +1,31 @@
+"""add_lookup_indexes
+
+Revision ID: 004_add_lookup_indexes
+Revises: 717171247f96
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_add_lookup_indexes'
+down_revision = '717171247f96'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite index also serves session_id-only lookups
+    op.create_index('ix_agent_responses_session_agent', 'agent_responses', ['session_id', 'agent_name'], unique=False)
+    op.drop_index(op.f('ix_agent_responses_session_id'), table_name='agent_responses')
+    # description is unbounded Text; index its md5 to stay under the btree row-size limit
+    op.create_index('ix_learning_lookup', 'aggregated_learnings', ['pattern_type', 'agent_name', sa.text('md5(description)')], unique=False)
+    op.create_index('ix_learning_rank', 'aggregated_learnings', [sa.text('frequency DESC'), sa.text('last_updated DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_learning_rank', table_name='aggregated_learnings')
+    op.drop_index('ix_learning_lookup', table_name='aggregated_learnings')
+    op.create_index(op.f('ix_agent_responses_session_id'), 'agent_responses', ['session_id'], unique=False)
+    op.drop_index('ix_agent_responses_session_agent', table_name='agent_responses')
@@ -0,0 +1,61 @@
+"""unique_learning_triplet
+
+Revision ID: 005_unique_learning_triplet
+Revises: 004_add_lookup_indexes
+Create Date: 2026-10-14 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_unique_learning_triplet'
+down_revision = '004_add_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+_DUPLICATES = """
+    SELECT pattern_type, agent_name, description,
+           SUM(frequency) AS frequency,
+           MAX(confidence_score) AS confidence_score,
+           MAX(last_updated) AS last_updated,
+           MIN(id::text) AS keep_id
+    FROM aggregated_learnings
+    GROUP BY pattern_type, agent_name, description
+    HAVING COUNT(*) > 1
+"""
+
+
+def upgrade() -> None:
+    # Merge duplicate learnings into one row before enforcing uniqueness
+    op.execute(f"""
+        UPDATE aggregated_learnings AS a
+        SET frequency = d.frequency,
+            confidence_score = d.confidence_score,
+            last_updated = d.last_updated
+        FROM ({_DUPLICATES}) AS d
+        WHERE a.id::text = d.keep_id
+    """)
+    op.execute(f"""
+        DELETE FROM aggregated_learnings AS a
+        USING ({_DUPLICATES}) AS d
+        WHERE a.pattern_type = d.pattern_type
+          AND a.agent_name = d.agent_name
+          AND a.description = d.description
+          AND a.id::text <> d.keep_id
+    """)
+    
+    # The unique index replaces the plain lookup index; description is
+    # unbounded Text, so its md5 keeps rows under the btree size limit
+    op.drop_index('ix_learning_lookup', table_name='aggregated_learnings')
+    op.create_index(
+        'uq_learning_triplet',
+        'aggregated_learnings',
+        ['pattern_type', 'agent_name', sa.text('md5(description)')],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_learning_triplet', table_name='aggregated_learnings')
+    op.create_index('ix_learning_lookup', 'aggregated_learnings', ['pattern_type', 'agent_name', sa.text('md5(description)')], unique=False)
@@ -0,0 +1,36 @@
+"""resume_trigram_index
+
+Revision ID: 006_resume_trigram_index
+Revises: 005_unique_learning_triplet
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_resume_trigram_index'
+down_revision = '005_unique_learning_triplet'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_resumes_text_trgm',
+        'resumes',
+        ['text_content', 'job_description', 'filename'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={
+            'text_content': 'gin_trgm_ops',
+            'job_description': 'gin_trgm_ops',
+            'filename': 'gin_trgm_ops',
+        },
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_text_trgm', table_name='resumes')
+    # Leave the pg_trgm extension installed (be careful in production)
+    # op.execute('DROP EXTENSION IF EXISTS pg_trgm')
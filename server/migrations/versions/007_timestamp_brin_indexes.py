@@ -0,0 +1,38 @@
+"""timestamp_brin_indexes
+
+Revision ID: 007_timestamp_brin_indexes
+Revises: 006_resume_trigram_index
+Create Date: 2026-10-14 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_timestamp_brin_indexes'
+down_revision = '006_resume_trigram_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Both columns grow with insertion order, which is what BRIN summarizes well
+    op.create_index(
+        'ix_learning_last_updated_brin',
+        'aggregated_learnings',
+        ['last_updated'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'ix_resumes_uploaded_at_brin',
+        'resumes',
+        ['uploaded_at'],
+        unique=False,
+        postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_uploaded_at_brin', table_name='resumes')
+    op.drop_index('ix_learning_last_updated_brin', table_name='aggregated_learnings')
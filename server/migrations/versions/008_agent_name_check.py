@@ -0,0 +1,29 @@
+"""agent_name_check
+
+Revision ID: 008_agent_name_check
+Revises: 007_timestamp_brin_indexes
+Create Date: 2026-10-14 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_agent_name_check'
+down_revision = '007_timestamp_brin_indexes'
+branch_labels = None
+depends_on = None
+
+AGENT_NAME_CHECK = "agent_name IN ('critic', 'advocate', 'realist')"
+
+
+def upgrade() -> None:
+    # Normalize any rows written before names were lowercased at the boundary
+    op.execute("UPDATE agent_responses SET agent_name = lower(agent_name) WHERE agent_name <> lower(agent_name)")
+    op.execute("UPDATE aggregated_learnings SET agent_name = lower(agent_name) WHERE agent_name <> lower(agent_name)")
+    op.create_check_constraint('ck_agent_responses_agent_name', 'agent_responses', AGENT_NAME_CHECK)
+    op.create_check_constraint('ck_aggregated_learnings_agent_name', 'aggregated_learnings', AGENT_NAME_CHECK)
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_aggregated_learnings_agent_name', 'aggregated_learnings', type_='check')
+    op.drop_constraint('ck_agent_responses_agent_name', 'agent_responses', type_='check')
@@ -0,0 +1,39 @@
+"""resume_search_document_index
+
+Revision ID: 009_resume_search_document_index
+Revises: 008_agent_name_check
+Create Date: 2026-10-14 16:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_resume_search_document_index'
+down_revision = '008_agent_name_check'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Expression must match core.models.RESUME_SEARCH_DOCUMENT for the planner to use it
+    op.execute(
+        "CREATE INDEX ix_resumes_search_trgm ON resumes USING gin "
+        "((filename || ' ' || job_description || ' ' || text_content) gin_trgm_ops)"
+    )
+    op.drop_index('ix_resumes_text_trgm', table_name='resumes')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_resumes_text_trgm',
+        'resumes',
+        ['text_content', 'job_description', 'filename'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={
+            'text_content': 'gin_trgm_ops',
+            'job_description': 'gin_trgm_ops',
+            'filename': 'gin_trgm_ops',
+        },
+    )
+    op.drop_index('ix_resumes_search_trgm', table_name='resumes')
@@ -0,0 +1,40 @@
+"""learning_description_hash
+
+Revision ID: 010_learning_description_hash
+Revises: 009_resume_search_document_index
+Create Date: 2026-10-14 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_learning_description_hash'
+down_revision = '009_resume_search_document_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('aggregated_learnings', sa.Column('description_hash', sa.LargeBinary(length=32), nullable=True))
+    # Same digest the model computes in Python: SHA-256 of the UTF-8 description
+    op.execute("UPDATE aggregated_learnings SET description_hash = sha256(convert_to(description, 'UTF8'))")
+    op.alter_column('aggregated_learnings', 'description_hash', nullable=False)
+    
+    op.drop_index('uq_learning_triplet', table_name='aggregated_learnings')
+    op.create_unique_constraint(
+        'uq_learning_triplet',
+        'aggregated_learnings',
+        ['pattern_type', 'agent_name', 'description_hash']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_learning_triplet', 'aggregated_learnings', type_='unique')
+    op.create_index(
+        'uq_learning_triplet',
+        'aggregated_learnings',
+        ['pattern_type', 'agent_name', sa.text('md5(description)')],
+        unique=True
+    )
+    op.drop_column('aggregated_learnings', 'description_hash')
@@ -1,10 +1,12 @@
 """Repository for feedback-related database operations."""
 
-from typing import List, Optional
-from uuid import UUID
 from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
 
-from sqlalchemy import select, desc, func, and_
+from sqlalchemy import case, select, desc, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -44,7 +46,6 @@ class FeedbackRepository:
         
         self.db_session.add(session)
         await self.db_session.flush()
-        await self.db_session.refresh(session)
         
         return session
     
@@ -60,7 +61,7 @@ class FeedbackRepository:
         
         Args:
             session_id: UUID of the feedback session
-            agent_name: Name of the agent (Critic, Advocate, Realist)
+            agent_name: Lowercase agent name (critic, advocate, realist)
             response_text: Full response text
             order: Order in the debate sequence
             
@@ -70,46 +71,91 @@ class FeedbackRepository:
         Raises:
             ValueError: If inputs are invalid
         """
-        # Validate inputs
+        response = self._build_agent_response(session_id, agent_name, response_text, order)
+        
+        self.db_session.add(response)
+        await self.db_session.flush()
+        
+        return response
+    
+    async def add_agent_responses_bulk(
+        self,
+        session_id: UUID,
+        responses: List[Tuple[str, str, int]]
+    ) -> List[AgentResponse]:
+        """
+        Add several agent responses to a feedback session with a single flush.
+        
+        Args:
+            session_id: UUID of the feedback session
+            responses: (lowercase agent_name, response_text, order) tuples
+            
+        Returns:
+            Created AgentResponse instances, in input order
+            
+        Raises:
+            ValueError: If any input is invalid
+        """
+        objs = [
+            self._build_agent_response(session_id, agent_name, response_text, order)
+            for agent_name, response_text, order in responses
+        ]
+        if not objs:
+            return objs
+        
+        self.db_session.add_all(objs)
+        await self.db_session.flush()
+        
+        return objs
+    
+    @staticmethod
+    def _build_agent_response(
+        session_id: UUID,
+        agent_name: str,
+        response_text: str,
+        order: int
+    ) -> AgentResponse:
+        """Validate inputs and build an unsaved AgentResponse."""
         if not session_id:
             raise ValueError("Session ID is required")
-        if not agent_name or not agent_name.strip():
+        # isspace() stops at the first non-space character and copies nothing
+        if not agent_name or agent_name.isspace():
             raise ValueError("Agent name is required")
-        if not response_text or not response_text.strip():
+        if not response_text or response_text.isspace():
             raise ValueError("Response text is required")
         if order < 0:
             raise ValueError("Order must be non-negative")
-        response = AgentResponse(
+        return AgentResponse(
             session_id=session_id,
-            agent_name=agent_name.lower(),
+            agent_name=agent_name,
             response_text=response_text,
             order=order
         )
-        
-        self.db_session.add(response)
-        await self.db_session.flush()
-        await self.db_session.refresh(response)
-        
-        return response
     
     async def complete_feedback_session(self, session_id: UUID) -> Optional[FeedbackSession]:
         """
         Mark feedback session as completed.
         
+        agent_responses is not loaded on the returned session; callers that
+        need it should use get_feedback_session_by_id.
+        
         Args:
             session_id: UUID of the feedback session
             
         Returns:
             Updated FeedbackSession or None if not found
         """
-        session = await self.get_feedback_session_by_id(session_id)
-        if not session:
-            return None
-        
-        session.status = "completed"
-        session.completed_at = datetime.utcnow()
+        # Single UPDATE ... RETURNING; completed_at is stamped by the database
+        stmt = (
+            update(FeedbackSession)
+            .where(FeedbackSession.id == session_id)
+            .values(status="completed", completed_at=func.now())
+            .returning(FeedbackSession)
+            .execution_options(populate_existing=True)
+        )
         
-        return session
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one_or_none()
     
     async def get_feedback_session_by_id(self, session_id: UUID) -> Optional[FeedbackSession]:
         """
@@ -147,17 +193,16 @@ class FeedbackRepository:
         Returns:
             Updated AgentResponse or None if not found
         """
-        stmt = select(AgentResponse).where(AgentResponse.id == response_id)
-        result = await self.db_session.execute(stmt)
-        response = result.scalar_one_or_none()
-        
-        if not response:
-            return None
-        
-        response.thumbs_up = thumbs_up
-        response.feedback_text = feedback_text
+        stmt = (
+            update(AgentResponse)
+            .where(AgentResponse.id == response_id)
+            .values(thumbs_up=thumbs_up, feedback_text=feedback_text)
+            .returning(AgentResponse)
+            .execution_options(populate_existing=True)
+        )
         
-        return response
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one_or_none()
     
     async def get_agent_response_by_session_and_name(
         self,
@@ -169,14 +214,14 @@ class FeedbackRepository:
         
         Args:
             session_id: UUID of the feedback session
-            agent_name: Name of the agent (Critic, Advocate, Realist)
+            agent_name: Lowercase agent name (critic, advocate, realist)
             
         Returns:
             AgentResponse or None if not found
         """
         stmt = select(AgentResponse).where(
             AgentResponse.session_id == session_id,
-            AgentResponse.agent_name == agent_name.lower()
+            AgentResponse.agent_name == agent_name
         )
         result = await self.db_session.execute(stmt)
         return result.scalar_one_or_none()
@@ -190,7 +235,7 @@ class FeedbackRepository:
         Get aggregated learning patterns for agent memory.
         
         Args:
-            agent_name: Optional filter by agent name
+            agent_name: Optional filter by lowercase agent name
             limit: Maximum number of learnings to return
             
         Returns:
@@ -203,11 +248,57 @@ class FeedbackRepository:
         )
         
         if agent_name:
-            stmt = stmt.where(AggregatedLearning.agent_name == agent_name.lower())
+            stmt = stmt.where(AggregatedLearning.agent_name == agent_name)
         
         result = await self.db_session.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_recent_learning_descriptions(
+        self, 
+        limit: int = 50,
+        agent_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get learning descriptions for agent memory without loading full rows.
+        
+        Args:
+            limit: Maximum number of descriptions to return
+            agent_name: Optional filter by lowercase agent name
+            
+        Returns:
+            Descriptions ordered by frequency and last_updated
+        """
+        stmt = (
+            select(AggregatedLearning.description)
+            .order_by(desc(AggregatedLearning.frequency), desc(AggregatedLearning.last_updated))
+            .limit(limit)
+        )
+        
+        if agent_name:
+            stmt = stmt.where(AggregatedLearning.agent_name == agent_name)
+        
+        result = await self.db_session.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def get_learning_watermark(self) -> Tuple[Optional[datetime], int, int]:
+        """
+        Get a cheap fingerprint of the learnings table.
+        
+        Any insert changes the count and any upsert increments the frequency
+        sum, so changes within one timestamp tick are still detected.
+        
+        Returns:
+            (latest last_updated, row count, total frequency)
+        """
+        stmt = select(
+            func.max(AggregatedLearning.last_updated),
+            func.count(),
+            func.coalesce(func.sum(AggregatedLearning.frequency), 0),
+        ).select_from(AggregatedLearning)
+        result = await self.db_session.execute(stmt)
+        latest, count, total_frequency = result.one()
+        return latest, count, total_frequency
+    
     async def create_or_update_learning(
         self,
         pattern_type: str,
@@ -221,45 +312,40 @@ class FeedbackRepository:
         Args:
             pattern_type: Type of pattern (e.g., 'positive_feedback', 'negative_feedback')
             description: Description of the learning pattern
-            agent_name: Name of the agent this applies to
+            agent_name: Lowercase name of the agent this applies to
             confidence_score: Confidence score for this pattern
             
         Returns:
             Created or updated AggregatedLearning instance
         """
-        # Try to find existing learning with same pattern and description
-        stmt = select(AggregatedLearning).where(
-            and_(
-                AggregatedLearning.pattern_type == pattern_type,
-                AggregatedLearning.description == description,
-                AggregatedLearning.agent_name == agent_name.lower()
-            )
-        )
-        
-        result = await self.db_session.execute(stmt)
-        existing = result.scalar_one_or_none()
-        
-        if existing:
-            # Update existing learning
-            existing.frequency += 1
-            existing.confidence_score = max(
-                existing.confidence_score, 
-                min(confidence_score, 0.95)  # Cap at 0.95
-            )
-            existing.last_updated = datetime.utcnow()
-            return existing
-        else:
-            # Create new learning
-            learning = AggregatedLearning(
+        # Single atomic upsert keyed on the (pattern_type, agent_name, description_hash)
+        # unique constraint; the SQLite form keeps it testable in memory
+        insert = pg_insert if self.db_session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        learnings = AggregatedLearning.__table__.c
+        capped_score = min(confidence_score, 0.95)  # Cap at 0.95
+        stmt = (
+            insert(AggregatedLearning)
+            .values(
                 pattern_type=pattern_type,
                 description=description,
-                agent_name=agent_name.lower(),
+                agent_name=agent_name,
                 confidence_score=confidence_score,
                 frequency=1
             )
-            
-            self.db_session.add(learning)
-            await self.db_session.flush()
-            await self.db_session.refresh(learning)
-            
-            return learning
\ No newline at end of file
+            .on_conflict_do_update(
+                index_elements=["pattern_type", "agent_name", "description_hash"],
+                set_={
+                    "frequency": learnings.frequency + 1,
+                    "confidence_score": case(
+                        (learnings.confidence_score > capped_score, learnings.confidence_score),
+                        else_=capped_score
+                    ),
+                    "last_updated": func.now(),
+                }
+            )
+            .returning(AggregatedLearning)
+            .execution_options(populate_existing=True)
+        )
+        
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one()
\ No newline at end of file
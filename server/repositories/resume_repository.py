@@ -3,11 +3,18 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, desc
+from sqlalchemy import delete, select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload, undefer
 
-from core.models import Resume
+from core.models import RESUME_SEARCH_DOCUMENT, AgentResponse, FeedbackSession, Resume
+
+
+# Eager-load the full resume tree; any other relationship access fails loudly
+_RESUME_TREE_OPTIONS = (
+    selectinload(Resume.feedback_sessions).selectinload(FeedbackSession.agent_responses),
+    raiseload("*"),
+)
 
 
 class ResumeRepository:
@@ -43,32 +50,35 @@ class ResumeRepository:
         Raises:
             ValueError: If required fields are missing
         """
-        # Validate inputs
-        if not filename or not filename.strip():
+        # Strip once for storage and validate the stripped values
+        filename = filename.strip() if filename else ""
+        text_content = text_content.strip() if text_content else ""
+        s3_url = s3_url.strip() if s3_url else ""
+        job_description = job_description.strip() if job_description else ""
+        if not filename:
             raise ValueError("Filename is required")
-        if not text_content or not text_content.strip():
+        if not text_content:
             raise ValueError("Text content is required")
-        if not s3_url or not s3_url.strip():
+        if not s3_url:
             raise ValueError("S3 URL is required")
-        if not job_description or not job_description.strip():
+        if not job_description:
             raise ValueError("Job description is required")
         
         resume = Resume(
-            filename=filename.strip(),
-            text_content=text_content.strip(),
-            s3_url=s3_url.strip(),
-            job_description=job_description.strip()
+            filename=filename,
+            text_content=text_content,
+            s3_url=s3_url,
+            job_description=job_description
         )
         
         self.db_session.add(resume)
         await self.db_session.flush()  # Get the ID without committing
-        await self.db_session.refresh(resume)
         
         return resume
     
     async def get_resume_by_id(self, resume_id: UUID) -> Optional[Resume]:
         """
-        Get resume by ID with all related feedback sessions.
+        Get resume by ID with all related feedback sessions and their responses.
         
         Args:
             resume_id: UUID of the resume
@@ -78,7 +88,36 @@ class ResumeRepository:
         """
         stmt = (
             select(Resume)
-            .options(selectinload(Resume.feedback_sessions))
+            .options(
+                undefer(Resume.text_content),
+                undefer(Resume.job_description),
+                *_RESUME_TREE_OPTIONS
+            )
+            .where(Resume.id == resume_id)
+        )
+        
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    async def get_resume_content_by_id(self, resume_id: UUID) -> Optional[Resume]:
+        """
+        Get a resume with its text content and job description only.
+        
+        Feedback sessions are not loaded; accessing them raises.
+        
+        Args:
+            resume_id: UUID of the resume
+            
+        Returns:
+            Resume instance or None if not found
+        """
+        stmt = (
+            select(Resume)
+            .options(
+                undefer(Resume.text_content),
+                undefer(Resume.job_description),
+                raiseload("*")
+            )
             .where(Resume.id == resume_id)
         )
         
@@ -89,6 +128,8 @@ class ResumeRepository:
         """
         Get most recently uploaded resumes.
         
+        text_content and job_description are not loaded.
+        
         Args:
             limit: Maximum number of resumes to return (1-100)
             
@@ -102,7 +143,7 @@ class ResumeRepository:
             raise ValueError("Limit must be between 1 and 100")
         stmt = (
             select(Resume)
-            .options(selectinload(Resume.feedback_sessions))
+            .options(*_RESUME_TREE_OPTIONS)
             .order_by(desc(Resume.uploaded_at))
             .limit(limit)
         )
@@ -120,17 +161,24 @@ class ResumeRepository:
         Returns:
             True if deletion successful, False if resume not found
         """
-        resume = await self.get_resume_by_id(resume_id)
-        if not resume:
-            return False
-        
-        await self.db_session.delete(resume)
-        return True
+        # Delete children first with set-based statements instead of loading
+        # the resume tree for the ORM cascade
+        session_ids = select(FeedbackSession.id).where(FeedbackSession.resume_id == resume_id)
+        await self.db_session.execute(
+            delete(AgentResponse).where(AgentResponse.session_id.in_(session_ids))
+        )
+        await self.db_session.execute(
+            delete(FeedbackSession).where(FeedbackSession.resume_id == resume_id)
+        )
+        result = await self.db_session.execute(delete(Resume).where(Resume.id == resume_id))
+        return result.rowcount > 0
     
     async def search_resumes_by_text(self, search_term: str, limit: int = 10) -> List[Resume]:
         """
         Search resumes by text content or job description.
         
+        Matched on the server; text_content and job_description are not loaded.
+        
         Args:
             search_term: Text to search for
             limit: Maximum number of results
@@ -145,11 +193,7 @@ class ResumeRepository:
         
         stmt = (
             select(Resume)
-            .where(
-                Resume.text_content.ilike(search_pattern) |
-                Resume.job_description.ilike(search_pattern) |
-                Resume.filename.ilike(search_pattern)
-            )
+            .where(RESUME_SEARCH_DOCUMENT.ilike(search_pattern))
             .order_by(desc(Resume.uploaded_at))
             .limit(limit)
         )
@@ -0,0 +1,223 @@
+"""Adaptive concurrency control for Azure OpenAI calls."""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when calls are rejected because the circuit breaker is open."""
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease concurrency limiter.
+
+    The concurrency limit grows by ``alpha`` after each healthy call
+    (no error and latency within ``latency_target``) and is multiplied by
+    ``beta`` after a slow or failed call, staying within ``[c_min, c_max]``.
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected for ``cooldown`` seconds instead of piling onto a
+    struggling provider.
+    """
+
+    def __init__(
+        self,
+        c_min: int = 1,
+        c_max: int = 32,
+        initial: int = 8,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target: float = 8.0,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ) -> None:
+        """Initialize the controller at the ``initial`` concurrency limit."""
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.limit = float(initial)
+        self.in_flight = 0
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free concurrency slot.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+        """
+        async with self._condition:
+            while True:
+                if time.monotonic() < self._open_until:
+                    raise CircuitOpenError("Azure OpenAI circuit open; retry later")
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                await self._condition.wait()
+
+    async def release(self, latency: float, error: bool = False, cancelled: bool = False) -> None:
+        """
+        Free a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Seconds until the provider responded
+            error: Whether the call hit a rate limit or server-side failure
+            cancelled: Whether the call ended without an outcome (e.g. the
+                client disconnected); the slot is freed but the limit is kept
+        """
+        async with self._condition:
+            self.in_flight -= 1
+
+            if cancelled and not error:
+                self._condition.notify_all()
+                return
+
+            if error:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= self.failure_threshold:
+                    self._open_until = time.monotonic() + self.cooldown
+                    logger.warning(
+                        "Circuit opened for %.0fs after %d consecutive failures",
+                        self.cooldown,
+                        self._consecutive_failures
+                    )
+            else:
+                self._consecutive_failures = 0
+
+            if error or latency > self.latency_target:
+                self.limit = max(float(self.c_min), self.limit * self.beta)
+            else:
+                self.limit = min(float(self.c_max), self.limit + self.alpha)
+
+            self._condition.notify_all()
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse a reset header such as ``"1s"``, ``"6m0s"`` or ``"20ms"`` into seconds."""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer header, ignoring missing or malformed values."""
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitTracker:
+    """Preemptive request/token budget tracking for Azure OpenAI.
+
+    Every response's ``x-ratelimit-*`` headers update the provider's view of
+    the remaining budget, and a local sliding window counts the requests and
+    tokens sent in the last ``window`` seconds. ``wait_if_throttled`` pauses a
+    call when the provider reports less than ``reserve`` of its budget left,
+    or when the call would overrun the reported per-window limits.
+    """
+
+    def __init__(self, window: float = 60.0, reserve: float = 0.1) -> None:
+        """Initialize the tracker with no known limits."""
+        self.window = window
+        self.reserve = reserve
+
+        self.limit_requests: Optional[int] = None
+        self.limit_tokens: Optional[int] = None
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.reset_at = 0.0
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._sent_tokens = 0
+        self._lock = asyncio.Lock()
+
+    async def observe(self, response: httpx.Response) -> None:
+        """httpx response hook recording the provider's rate-limit headers."""
+        headers = response.headers
+        if "x-ratelimit-remaining-requests" not in headers and "x-ratelimit-remaining-tokens" not in headers:
+            return
+
+        self.limit_requests = _parse_int(headers.get("x-ratelimit-limit-requests")) or self.limit_requests
+        self.limit_tokens = _parse_int(headers.get("x-ratelimit-limit-tokens")) or self.limit_tokens
+        self.remaining_requests = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+        self.remaining_tokens = _parse_int(headers.get("x-ratelimit-remaining-tokens"))
+
+        resets = [
+            seconds for seconds in (
+                _parse_reset(headers.get("x-ratelimit-reset-requests")),
+                _parse_reset(headers.get("x-ratelimit-reset-tokens")),
+            )
+            if seconds is not None
+        ]
+        self.reset_at = time.monotonic() + (max(resets) if resets else 1.0)
+
+    def _delay(self, estimated_tokens: int, now: float) -> float:
+        """Seconds to wait before sending ``estimated_tokens``; 0 when clear."""
+        while self._sent and self._sent[0][0] <= now - self.window:
+            self._sent_tokens -= self._sent.popleft()[1]
+
+        # Provider says the budget is nearly spent: wait for its reset
+        if now < self.reset_at and (
+            self._below_reserve(self.remaining_requests, self.limit_requests)
+            or self._below_reserve(self.remaining_tokens, self.limit_tokens)
+        ):
+            return self.reset_at - now
+
+        # Local window would overrun the reported limits: wait for the oldest send to expire
+        over_requests = self.limit_requests is not None and len(self._sent) + 1 > self.limit_requests
+        over_tokens = (
+            self.limit_tokens is not None
+            and self._sent_tokens + estimated_tokens > self.limit_tokens
+        )
+        if (over_requests or over_tokens) and self._sent:
+            return self._sent[0][0] + self.window - now
+
+        return 0.0
+
+    def _below_reserve(self, remaining: Optional[int], limit: Optional[int]) -> bool:
+        """Whether a reported remaining budget is under the reserve fraction."""
+        if remaining is None:
+            return False
+        if limit:
+            return remaining < limit * self.reserve
+        return remaining <= 0
+
+    async def wait_if_throttled(self, estimated_tokens: int) -> None:
+        """
+        Pause until sending ``estimated_tokens`` fits the known budget, then record it.
+
+        Args:
+            estimated_tokens: Prompt plus completion tokens the call may use
+        """
+        async with self._lock:
+            while (delay := self._delay(estimated_tokens, time.monotonic())) > 0:
+                logger.info("Rate limit budget low; delaying request %.2fs", delay)
+                await asyncio.sleep(delay)
+            self._sent.append((time.monotonic(), estimated_tokens))
+            self._sent_tokens += estimated_tokens
+
+
+# Shared by every LLMService in the process
+llm_controller = AIMDController()
+rate_limit_tracker = RateLimitTracker()
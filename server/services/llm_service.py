@@ -1,15 +1,150 @@
 """LLM service for Azure OpenAI API interactions."""
 
 import logging
-from typing import AsyncGenerator, List, Optional
+import time
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, List, Optional, Sequence, Tuple
 
+import httpx
 import openai
+import tiktoken
 from openai import AsyncAzureOpenAI
 
 from config import get_settings
+from .backpressure import llm_controller, rate_limit_tracker
 
 logger = logging.getLogger(__name__)
 
+# Provider-side overload signals that shrink the concurrency limit
+_OVERLOAD_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+)
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client() -> AsyncAzureOpenAI:
+    """Get the process-wide Azure OpenAI client and its keep-alive pool."""
+    settings = get_settings()
+    return AsyncAzureOpenAI(
+        api_key=settings.azure_openai_api_key,
+        azure_endpoint=settings.azure_openai_endpoint,
+        api_version=settings.azure_openai_api_version,
+        # httpx's read timeout applies per socket read, so it also aborts a
+        # stream that stalls between chunks instead of holding its slot
+        timeout=httpx.Timeout(
+            connect=5.0,
+            read=settings.openai_read_timeout,
+            write=10.0,
+            pool=5.0,
+        ),
+        max_retries=settings.openai_max_retries,
+        # HTTP/2 multiplexes concurrent agent streams over one TLS connection
+        http_client=openai.DefaultAsyncHttpxClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,  # Connection-level retries only
+            ),
+            event_hooks={"response": [rate_limit_tracker.observe]},
+        ),
+    )
+
+
+async def close_llm_client() -> None:
+    """Close the shared client's connection pool, if it was created."""
+    if _get_llm_client.cache_info().currsize:
+        await _get_llm_client().close()
+        _get_llm_client.cache_clear()
+
+
+@lru_cache(maxsize=16)
+def _system_message(system_prompt: str) -> Dict[str, str]:
+    """Build the (static, per-agent) system prompt message once."""
+    return {"role": "system", "content": system_prompt}
+
+
+@lru_cache(maxsize=256)
+def _memory_message(memory_context: Tuple[str, ...]) -> Dict[str, str]:
+    """Build the memory-context message once per distinct set of learnings."""
+    memory_text = "\n".join(memory_context)
+    return {
+        "role": "system",
+        "content": f"Based on previous feedback, consider these patterns:\n{memory_text}"
+    }
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Get the BPE encoding for a model, loaded once per process."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Azure deployment names need not match an OpenAI model name
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def load_token_encoding(model: str) -> None:
+    """
+    Load the BPE encoding for a model ahead of the first token count.
+    
+    tiktoken downloads the encoding file on first use unless it is already
+    in ``TIKTOKEN_CACHE_DIR``, so call this at startup rather than leaving
+    the download to a request.
+    
+    Args:
+        model: Model or deployment name used to pick the encoding
+    """
+    _get_encoding(model)
+
+
+@lru_cache(maxsize=256)
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count BPE tokens in text for the given model.
+    
+    Cached on the text itself, so repeat checks of the same resume or
+    job description are a dict lookup.
+    
+    Args:
+        text: Text to count tokens for
+        model: Model or deployment name used to pick the encoding
+        
+    Returns:
+        Token count
+    """
+    return len(_get_encoding(model).encode(text, disallowed_special=()))
+
+
+def count_tokens_within(text: str, limit: int, model: str) -> int:
+    """
+    Count tokens for a limit check, skipping BPE when length alone decides.
+    
+    Every token spans at least one UTF-8 byte, so text with no more than
+    ``limit`` bytes (ASCII characters are one byte, others at most four) can
+    never exceed it and is accepted with a ~4 characters/token estimate.
+    A single token can span arbitrarily many characters (runs of
+    whitespace or punctuation), so no length proves text is over the limit;
+    anything that might be is tokenized exactly.
+    
+    Args:
+        text: Text to count tokens for
+        limit: Token limit the caller will compare against
+        model: Model or deployment name used to pick the encoding
+        
+    Returns:
+        Exact token count, or an estimate capped at ``limit`` when under it
+    """
+    length = len(text)
+    if length * 4 <= limit or (length <= limit and text.isascii()):
+        return min(-(-length // 4), limit)
+    return count_tokens(text, model)
+
 
 class LLMService:
     """Service responsible for Azure OpenAI API interactions.
@@ -20,13 +155,14 @@ class LLMService:
     """
     
     def __init__(self) -> None:
-        """Initialize the LLM service with Azure OpenAI client."""
+        """Initialize the LLM service with the shared Azure OpenAI client."""
         self.settings = get_settings()
-        self.client = AsyncAzureOpenAI(
-            api_key=self.settings.azure_openai_api_key,
-            azure_endpoint=self.settings.azure_openai_endpoint,
-            api_version=self.settings.azure_openai_api_version,
-        )
+        self.client = _get_llm_client()
+        # Bound once; read on every request and validation
+        self._deployment = self.settings.azure_openai_deployment
+        self._max_tokens = self.settings.openai_max_tokens
+        self._batch_chars = self.settings.stream_batch_chars
+        self._batch_interval = self.settings.stream_batch_interval_s
     
     async def generate_agent_response(
         self,
@@ -51,31 +187,65 @@ class LLMService:
             RuntimeError: If API call fails
         """
         try:
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # Add memory context if available
-            if memory_context:
-                memory_text = "\n".join(memory_context)
-                messages.append({
-                    "role": "system", 
-                    "content": f"Based on previous feedback, consider these patterns:\n{memory_text}"
-                })
+            messages = self._build_messages(system_prompt, user_message, memory_context)
             
-            messages.append({"role": "user", "content": user_message})
+            await rate_limit_tracker.wait_if_throttled(self._estimate_request_tokens(messages))
             
-            stream = await self.client.chat.completions.create(
-                model=self.settings.azure_openai_deployment,
-                messages=messages,
-                max_completion_tokens=self.settings.openai_max_tokens,
-                temperature=0.7,
-                stream=True
-            )
-            
-            async for chunk in stream:
-                if hasattr(chunk, 'choices') and chunk.choices:
-                    choice = chunk.choices[0]
-                    if hasattr(choice, 'delta') and choice.delta and hasattr(choice.delta, 'content') and choice.delta.content:
-                        yield choice.delta.content
+            # The slot is held for the whole stream; latency is time to response
+            await llm_controller.acquire()
+            started = time.monotonic()
+            latency = None
+            overloaded = False
+            completed = False
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self._deployment,
+                    messages=messages,
+                    max_completion_tokens=self._max_tokens,
+                    temperature=0.7,
+                    stream=True
+                )
+                latency = time.monotonic() - started
+                
+                # Coalesce tiny deltas so consumers wake per batch, not per token
+                batch_chars = self._batch_chars
+                batch_interval = self._batch_interval
+                buffer: List[str] = []
+                buffered = 0
+                last_flush = time.monotonic()
+                
+                async for chunk in stream:
+                    # EAFP: choices is empty on usage/filter-only chunks, delta may be None
+                    try:
+                        content = chunk.choices[0].delta.content
+                    except (IndexError, AttributeError):
+                        continue
+                    if not content:
+                        continue
+                    
+                    buffer.append(content)
+                    buffered += len(content)
+                    now = time.monotonic()
+                    if buffered >= batch_chars or now - last_flush >= batch_interval:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        buffered = 0
+                        last_flush = now
+                
+                if buffer:
+                    yield "".join(buffer)
+                completed = True
+            except _OVERLOAD_ERRORS:
+                overloaded = True
+                raise
+            finally:
+                # A consumer that stops early (client disconnect) closes the
+                # generator mid-stream; that says nothing about provider health
+                await llm_controller.release(
+                    latency if latency is not None else time.monotonic() - started,
+                    error=overloaded,
+                    cancelled=not (completed or overloaded)
+                )
                     
         except openai.APIError as e:
             logger.error("OpenAI API error for %s: %s", agent_name, str(e))
@@ -111,25 +281,32 @@ class LLMService:
             RuntimeError: If API call fails
         """
         try:
-            messages = [{"role": "system", "content": system_prompt}]
+            messages = self._build_messages(system_prompt, user_message, memory_context)
             
-            # Add memory context if available
-            if memory_context:
-                memory_text = "\n".join(memory_context)
-                messages.append({
-                    "role": "system", 
-                    "content": f"Based on previous feedback, consider these patterns:\n{memory_text}"
-                })
+            await rate_limit_tracker.wait_if_throttled(self._estimate_request_tokens(messages))
             
-            messages.append({"role": "user", "content": user_message})
-            
-            response = await self.client.chat.completions.create(
-                model=self.settings.azure_openai_deployment,
-                messages=messages,
-                max_completion_tokens=self.settings.openai_max_tokens,
-                temperature=0.7,
-                stream=False
-            )
+            await llm_controller.acquire()
+            started = time.monotonic()
+            overloaded = False
+            completed = False
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self._deployment,
+                    messages=messages,
+                    max_completion_tokens=self._max_tokens,
+                    temperature=0.7,
+                    stream=False
+                )
+                completed = True
+            except _OVERLOAD_ERRORS:
+                overloaded = True
+                raise
+            finally:
+                await llm_controller.release(
+                    time.monotonic() - started,
+                    error=overloaded,
+                    cancelled=not (completed or overloaded)
+                )
             
             return response.choices[0].message.content if response.choices else ""
             
@@ -140,6 +317,25 @@ class LLMService:
         except Exception as e:
             raise RuntimeError(f"Unexpected error with OpenAI: {str(e)}")
     
+    def _build_messages(
+        self,
+        system_prompt: str,
+        user_message: str,
+        memory_context: Optional[Sequence[str]]
+    ) -> List[Dict[str, str]]:
+        """Assemble chat messages, reusing cached system and memory messages."""
+        messages = [_system_message(system_prompt)]
+        if memory_context:
+            messages.append(_memory_message(tuple(memory_context)))
+        messages.append({"role": "user", "content": user_message})
+        return messages
+    
+    def _estimate_request_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """Estimate the rate-limit cost of a request: prompt plus completion budget."""
+        # ~4 characters per token; a full BPE encode here would block the event loop
+        prompt_tokens = sum(-(-len(message["content"]) // 4) for message in messages)
+        return prompt_tokens + self._max_tokens
+    
     def validate_token_count(self, text: str, limit: int, context: str) -> None:
         """
         Validate text doesn't exceed token limit.
@@ -152,12 +348,11 @@ class LLMService:
         Raises:
             ValueError: If text exceeds token limit
         """
-        # Rough estimation: 1 token ≈ 0.75 words
-        estimated_tokens = len(text.split()) * 1.33
+        estimated_tokens = count_tokens_within(text, limit, self._deployment)
         
         if estimated_tokens > limit:
             raise ValueError(
-                f"{context} is too long: approximately {int(estimated_tokens)} tokens "
+                f"{context} is too long: approximately {estimated_tokens} tokens "
                 f"(limit: {limit})"
             )
     
@@ -171,5 +366,4 @@ class LLMService:
         Returns:
             Estimated token count
         """
-        # Rough estimation: 1 token ≈ 0.75 words
-        return int(len(text.split()) * 1.33)
\ No newline at end of file
+        return count_tokens(text, self._deployment)
\ No newline at end of file
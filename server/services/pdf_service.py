@@ -1,12 +1,15 @@
 """PDF parsing service for extracting text from uploaded PDFs."""
 
+import asyncio
 import logging
-from io import BytesIO
-from typing import Dict, Any
+import os
+from io import BytesIO, StringIO
+from typing import Any, BinaryIO, Dict
 
 from pypdf import PdfReader
 
 from config import get_settings
+from .llm_service import count_tokens_within
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,10 @@ class PDFService:
     def __init__(self) -> None:
         """Initialize the PDF service."""
         self.settings = get_settings()
+        # Bound once; read on every extraction and validation
+        self._deployment = self.settings.azure_openai_deployment
+        self._resume_token_limit = self.settings.resume_token_limit
+        self._job_description_token_limit = self.settings.job_description_token_limit
     
     async def extract_text_from_pdf(self, pdf_content: bytes) -> Dict[str, Any]:
         """
@@ -32,32 +39,69 @@ class PDFService:
         Returns:
             Dictionary containing extracted text and metadata
             
+        Raises:
+            ValueError: If PDF is invalid or corrupted
+            RuntimeError: If text extraction fails
+        """
+        return await self.extract_text_from_pdf_stream(BytesIO(pdf_content))
+    
+    async def extract_text_from_pdf_stream(self, pdf_file: BinaryIO) -> Dict[str, Any]:
+        """
+        Extract text content from a seekable PDF file object.
+        
+        The file is parsed in place, so large uploads spooled to disk are
+        never copied into a single bytes object.
+        
+        Args:
+            pdf_file: Seekable binary file object positioned anywhere
+            
+        Returns:
+            Dictionary containing extracted text and metadata
+            
         Raises:
             ValueError: If PDF is invalid or corrupted
             RuntimeError: If text extraction fails
         """
         # Input validation
-        if not pdf_content:
+        size = pdf_file.seek(0, os.SEEK_END)
+        pdf_file.seek(0)
+        if not size:
             raise ValueError("PDF content cannot be empty")
         
-        if len(pdf_content) > 50 * 1024 * 1024:  # 50MB limit
+        if size > 50 * 1024 * 1024:  # 50MB limit
             raise ValueError("PDF file too large (limit: 50MB)")
             
+        # pypdf parsing is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._extract_text_sync, pdf_file)
+    
+    def _extract_text_sync(self, pdf_file: BinaryIO) -> Dict[str, Any]:
+        """Parse a validated PDF file object and extract its text.
+        
+        Args:
+            pdf_file: Seekable binary file object positioned at the start
+            
+        Returns:
+            Dictionary containing extracted text and metadata
+        """
         try:
-            pdf_stream = BytesIO(pdf_content)
-            reader = PdfReader(pdf_stream)
+            reader = PdfReader(pdf_file)
             
             # Validate PDF
             if len(reader.pages) == 0:
                 raise ValueError("PDF contains no pages")
             
-            # Extract text from all pages
-            text_content = []
+            # Write page text straight into one buffer instead of list + join
+            buf = StringIO()
+            any_text = False
             for page_num, page in enumerate(reader.pages, 1):
                 try:
                     page_text = page.extract_text()
                     if page_text.strip():
-                        text_content.append(f"Page {page_num}:\n{page_text}")
+                        if any_text:
+                            buf.write("\n\n")
+                        buf.write(f"Page {page_num}:\n")
+                        buf.write(page_text)
+                        any_text = True
                 except Exception as e:
                     # Log warning but continue with other pages
                     logger.warning(
@@ -66,17 +110,17 @@ class PDFService:
                         str(e)
                     )
             
-            if not text_content:
+            if not any_text:
                 raise ValueError("No text content could be extracted from PDF")
             
-            full_text = "\n\n".join(text_content)
+            full_text = buf.getvalue()
             
-            # Check token limits with better estimation
-            estimated_tokens = self._estimate_tokens(full_text)
-            if estimated_tokens > self.settings.resume_token_limit:
+            # Check token limits
+            estimated_tokens = self._estimate_tokens(full_text, self._resume_token_limit)
+            if estimated_tokens > self._resume_token_limit:
                 raise ValueError(
                     f"Resume text too long: {estimated_tokens} tokens "
-                    f"(limit: {self.settings.resume_token_limit})"
+                    f"(limit: {self._resume_token_limit})"
                 )
             
             # Extract metadata
@@ -118,22 +162,23 @@ class PDFService:
         if not job_description or not job_description.strip():
             raise ValueError("Job description cannot be empty")
         
-        estimated_tokens = len(job_description.split())
-        estimated_tokens = self._estimate_tokens(job_description)
-        if estimated_tokens > self.settings.job_description_token_limit:
+        estimated_tokens = self._estimate_tokens(
+            job_description, self._job_description_token_limit
+        )
+        if estimated_tokens > self._job_description_token_limit:
             raise ValueError(
                 f"Job description too long: {estimated_tokens} tokens "
-                f"(limit: {self.settings.job_description_token_limit})"
+                f"(limit: {self._job_description_token_limit})"
             )
     
-    def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text.
+    def _estimate_tokens(self, text: str, limit: int) -> int:
+        """Estimate token count for text checked against a limit.
         
         Args:
             text: Text to estimate tokens for
+            limit: Token limit the count will be compared against
             
         Returns:
-            Estimated token count
+            Estimated token count, exact near the limit
         """
-        # More accurate estimation: ~0.75 words per token
-        return int(len(text.split()) * 1.33)
\ No newline at end of file
+        return count_tokens_within(text, limit, self._deployment)
\ No newline at end of file
@@ -1,18 +1,50 @@
 """S3 service for managing PDF file uploads and storage."""
 
+import asyncio
 import logging
-import uuid
-from datetime import datetime
+import os
+import shutil
+import time
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
-
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from secrets import token_hex
+from typing import TYPE_CHECKING, BinaryIO, Optional
+from urllib.parse import urlsplit
 
 from config import get_settings
 
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.client import BaseClient
+    from botocore.exceptions import ClientError
+
 logger = logging.getLogger(__name__)
 
+# Byte table mapping every unsafe ASCII byte to "_" for _sanitize_filename
+_SAFE_FILENAME_CHARS = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-_"
+_FILENAME_TABLE = bytes(b if b in _SAFE_FILENAME_CHARS else ord("_") for b in range(256))
+
+
+@lru_cache(maxsize=1)
+def _transfer_config() -> "TransferConfig":
+    """Multipart settings: parts above 8 MB are uploaded in parallel."""
+    from boto3.s3.transfer import TransferConfig
+    
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
+    )
+
+
+def _client_error() -> "type[ClientError]":
+    """botocore's ClientError, resolved only when an ``except`` clause is reached."""
+    from botocore.exceptions import ClientError
+    
+    return ClientError
+
 
 class S3Service:
     """Service responsible for S3 operations.
@@ -24,20 +56,28 @@ class S3Service:
     def __init__(self) -> None:
         """Initialize the S3 service."""
         self.settings = get_settings()
-        self._client: Optional[boto3.client] = None
+        self._client: Optional["BaseClient"] = None
+        # Bound once; read on every upload and delete
+        self._bucket = self.settings.s3_bucket_name
+        self._region = self.settings.aws_region
+        self._local = self.settings.environment == "development"
         # Local storage for development
         self.local_storage_dir = Path("/app/local_s3")
-        if self.settings.environment == "development":
+        if self._local:
             self.local_storage_dir.mkdir(parents=True, exist_ok=True)
     
     def _use_local_storage(self) -> bool:
         """Check if we should use local storage instead of S3."""
-        return self.settings.environment == "development"
+        return self._local
     
     @property
-    def client(self) -> boto3.client:
+    def client(self) -> "BaseClient":
         """Get or create S3 client with lazy initialization."""
         if self._client is None:
+            # boto3 is slow to import; only pay for it once S3 is used
+            import boto3
+            from botocore.exceptions import NoCredentialsError
+            
             try:
                 # For development with LocalStack
                 if self.settings.aws_endpoint_url:
@@ -45,7 +85,7 @@ class S3Service:
                         's3',
                         aws_access_key_id=self.settings.aws_access_key_id,
                         aws_secret_access_key=self.settings.aws_secret_access_key,
-                        region_name=self.settings.aws_region,
+                        region_name=self._region,
                         endpoint_url=self.settings.aws_endpoint_url
                     )
                 else:
@@ -53,7 +93,7 @@ class S3Service:
                         's3',
                         aws_access_key_id=self.settings.aws_access_key_id,
                         aws_secret_access_key=self.settings.aws_secret_access_key,
-                        region_name=self.settings.aws_region
+                        region_name=self._region
                     )
             except NoCredentialsError:
                 raise RuntimeError("AWS credentials not configured properly")
@@ -78,13 +118,39 @@ class S3Service:
             ValueError: If upload parameters are invalid
             RuntimeError: If upload fails
         """
-        if not pdf_content:
+        return await self.upload_pdf_stream(BytesIO(pdf_content), original_filename)
+    
+    async def upload_pdf_stream(
+        self, 
+        pdf_file: BinaryIO, 
+        original_filename: str
+    ) -> str:
+        """
+        Upload a seekable PDF file object to S3 and return the URL.
+        
+        The file is streamed with a managed (multipart for large files)
+        upload instead of being read into memory first.
+        
+        Args:
+            pdf_file: Seekable binary file object positioned anywhere
+            original_filename: Original filename from upload
+            
+        Returns:
+            S3 URL of the uploaded file
+            
+        Raises:
+            ValueError: If upload parameters are invalid
+            RuntimeError: If upload fails
+        """
+        size = pdf_file.seek(0, os.SEEK_END)
+        pdf_file.seek(0)
+        if not size:
             raise ValueError("PDF content cannot be empty")
         
         if not original_filename or not original_filename.strip():
             raise ValueError("Original filename cannot be empty")
             
-        if len(pdf_content) > 50 * 1024 * 1024:  # 50MB limit
+        if size > 50 * 1024 * 1024:  # 50MB limit
             raise ValueError("PDF file too large (limit: 50MB)")
             
         if not original_filename.lower().endswith('.pdf'):
@@ -92,8 +158,8 @@ class S3Service:
         
         try:
             # Generate unique filename
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+            unique_id = token_hex(4)
             safe_filename = self._sanitize_filename(original_filename)
             s3_key = f"resumes/{timestamp}_{unique_id}_{safe_filename}"
             
@@ -105,43 +171,47 @@ class S3Service:
                 local_file_path = self.local_storage_dir / s3_key
                 local_file_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                # Write file to local storage
-                with open(local_file_path, 'wb') as f:
-                    f.write(pdf_content)
+                # Write file to local storage without blocking the event loop
+                await asyncio.to_thread(self._write_local, pdf_file, local_file_path)
                 
                 logger.info("File saved locally at: %s", local_file_path)
                 
                 # Return a mock S3 URL for development
-                s3_url = f"http://localhost:4566/{self.settings.s3_bucket_name}/{s3_key}"
+                s3_url = f"http://localhost:4566/{self._bucket}/{s3_key}"
             else:
                 # Upload to real S3/LocalStack
                 logger.info(
                     "Uploading to S3: bucket=%s, key=%s", 
-                    self.settings.s3_bucket_name, 
+                    self._bucket, 
                     s3_key
                 )
                 
-                self.client.put_object(
-                    Bucket=self.settings.s3_bucket_name,
-                    Key=s3_key,
-                    Body=pdf_content,
-                    ContentType="application/pdf",
-                    Metadata={
-                        "original_filename": original_filename,
-                        "upload_timestamp": timestamp,
-                    }
+                # boto3 is blocking; run the transfer in a worker thread
+                await asyncio.to_thread(
+                    self.client.upload_fileobj,
+                    pdf_file,
+                    self._bucket,
+                    s3_key,
+                    ExtraArgs={
+                        "ContentType": "application/pdf",
+                        "Metadata": {
+                            "original_filename": original_filename,
+                            "upload_timestamp": timestamp,
+                        },
+                    },
+                    Config=_transfer_config()
                 )
                 
                 # Generate S3 URL
                 if self.settings.aws_endpoint_url:
                     # LocalStack URL
-                    s3_url = f"{self.settings.aws_endpoint_url}/{self.settings.s3_bucket_name}/{s3_key}"
+                    s3_url = f"{self.settings.aws_endpoint_url}/{self._bucket}/{s3_key}"
                 else:
                     # Real AWS S3 URL
-                    s3_url = f"https://{self.settings.s3_bucket_name}.s3.{self.settings.aws_region}.amazonaws.com/{s3_key}"
+                    s3_url = f"https://{self._bucket}.s3.{self._region}.amazonaws.com/{s3_key}"
             return s3_url
             
-        except ClientError as e:
+        except _client_error() as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             logger.error(
                 "S3 ClientError during upload: %s - %s", 
@@ -172,13 +242,14 @@ class S3Service:
             if not s3_key:
                 return False
             
-            self.client.delete_object(
-                Bucket=self.settings.s3_bucket_name,
+            await asyncio.to_thread(
+                self.client.delete_object,
+                Bucket=self._bucket,
                 Key=s3_key
             )
             return True
             
-        except ClientError as e:
+        except _client_error() as e:
             # Log error but don't raise - deletion failures shouldn't break the app
             logger.warning("Failed to delete S3 object %s: %s", s3_url, str(e))
             return False
@@ -186,6 +257,12 @@ class S3Service:
             logger.warning("Unexpected error deleting S3 object %s: %s", s3_url, str(e))
             return False
     
+    @staticmethod
+    def _write_local(pdf_file: BinaryIO, path: Path) -> None:
+        """Copy a PDF file object to local development storage."""
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(pdf_file, f)
+    
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename for S3 storage.
@@ -196,9 +273,8 @@ class S3Service:
         Returns:
             Sanitized filename safe for S3
         """
-        # Remove or replace unsafe characters
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-_"
-        sanitized = "".join(c if c in safe_chars else "_" for c in filename)
+        # Replace unsafe characters in C; non-ASCII characters become "?" first
+        sanitized = filename.encode("ascii", "replace").translate(_FILENAME_TABLE).decode("ascii")
         
         # Ensure it doesn't start with a dot or dash
         if sanitized.startswith(('.', '-')):
@@ -221,15 +297,14 @@ class S3Service:
         Returns:
             S3 key or None if URL is invalid
         """
+        # Handle both s3:// and https:// URLs from a single parse
         try:
-            # Handle both s3:// and https:// URLs
-            if s3_url.startswith(f"https://{self.settings.s3_bucket_name}.s3."):
-                # Extract from https URL
-                parts = s3_url.split(f"{self.settings.s3_bucket_name}.s3.{self.settings.aws_region}.amazonaws.com/")
-                return parts[1] if len(parts) > 1 else None
-            elif s3_url.startswith("s3://"):
-                # Extract from s3:// URL
-                return s3_url.replace(f"s3://{self.settings.s3_bucket_name}/", "")
+            parts = urlsplit(s3_url)
+        except ValueError:
             return None
-        except Exception:
-            return None
\ No newline at end of file
+        bucket = self._bucket
+        if parts.scheme == "s3" and parts.netloc == bucket:
+            return parts.path.lstrip("/") or None
+        if parts.scheme == "https" and parts.netloc.startswith(f"{bucket}.s3."):
+            return parts.path.lstrip("/") or None
+        return None
\ No newline at end of file
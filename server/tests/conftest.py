@@ -2,16 +2,19 @@
 
 import pytest
 import asyncio
+import copy
+from types import MappingProxyType, SimpleNamespace
 from typing import AsyncGenerator
 from unittest.mock import Mock, AsyncMock
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from httpx import AsyncClient
+from sqlalchemy.pool import StaticPool
+from httpx import ASGITransport, AsyncClient
 
 from database import Base
 from main import app
 from services import PDFService, S3Service, LLMService
+from services.llm_service import count_tokens
 from repositories import ResumeRepository, FeedbackRepository
 from unittest.mock import patch
 
@@ -28,10 +31,16 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def test_engine():
-    """Create test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    """Create the shared in-memory test database engine once per session."""
+    # StaticPool keeps one connection, so every test sees the same in-memory DB
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     
     # Create tables
     async with engine.begin() as conn:
@@ -44,36 +53,99 @@ async def test_engine():
 
 @pytest.fixture
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
+    """Create a test database session rolled back after each test."""
+    async with test_engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await conn.rollback()
+
+
+class _WhitespaceEncoding:
+    """Offline stand-in for a tiktoken encoding: one token per word."""
     
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    def encode(self, text: str, disallowed_special=()) -> list:
+        return text.split()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def offline_token_encoding():
+    """Keep token counting hermetic; the real BPE file is downloaded on first use."""
+    with patch('services.llm_service._get_encoding', return_value=_WhitespaceEncoding()):
+        count_tokens.cache_clear()
+        yield
+    count_tokens.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """Create the ASGI transport for the app once per session."""
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="module")
+def mocked_services():
+    """Patch services once per module to avoid filesystem and external operations."""
+    mock_result = {
+        "text_content": "Mock resume text content",
+        "metadata": {"page_count": 1, "estimated_tokens": 50}
+    }
+    mock_url = "https://test-bucket.s3.amazonaws.com/test.pdf"
+    patchers = [
+        patch('services.s3_service.S3Service.__init__', return_value=None),
+        patch('services.s3_service.S3Service.upload_pdf', new_callable=AsyncMock, return_value=mock_url),
+        patch('services.pdf_service.PDFService.extract_text_from_pdf', new_callable=AsyncMock, return_value=mock_result),
+        patch('services.s3_service.S3Service.upload_pdf_stream', new_callable=AsyncMock, return_value=mock_url),
+        patch('services.pdf_service.PDFService.extract_text_from_pdf_stream', new_callable=AsyncMock, return_value=mock_result),
+        patch('services.pdf_service.PDFService.validate_job_description'),
+    ]
+    for patcher in patchers:
+        patcher.start()
+    yield
+    for patcher in reversed(patchers):
+        patcher.stop()
 
 
 @pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+async def client(asgi_transport, mocked_services) -> AsyncGenerator[AsyncClient, None]:
     """Create test HTTP client."""
-    from httpx import ASGITransport
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def pdf_service() -> PDFService:
+    """Create one PDF service per module; extraction and validation are stateless."""
+    return PDFService()
+
+
+@pytest.fixture(scope="session")
+def _pdf_reader_prototype() -> SimpleNamespace:
+    """Build the attribute shape of a parsed PDF once per session."""
+    return SimpleNamespace(pages=[], metadata=None, source=None)
+
+
+@pytest.fixture
+def pdf_reader_mock(_pdf_reader_prototype, monkeypatch) -> SimpleNamespace:
+    """Patch PdfReader to return a per-test copy of the prototype reader.
     
-    # Mock services to avoid filesystem and external operations
-    with patch('services.s3_service.S3Service.__init__', return_value=None), \
-         patch('services.s3_service.S3Service.upload_pdf', new_callable=AsyncMock) as mock_s3_upload, \
-         patch('services.pdf_service.PDFService.extract_text_from_pdf', new_callable=AsyncMock) as mock_pdf_extract, \
-         patch('services.pdf_service.PDFService.validate_job_description') as mock_pdf_validate:
-        
-        mock_s3_upload.return_value = "https://test-bucket.s3.amazonaws.com/test.pdf"
-        mock_pdf_extract.return_value = {
-            "text_content": "Mock resume text content",
-            "metadata": {"page_count": 1, "estimated_tokens": 50}
-        }
-        
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            yield client
+    The stream passed to PdfReader is recorded on the reader as ``source``.
+    """
+    reader = copy.copy(_pdf_reader_prototype)
+    
+    def fake_pdf_reader(stream):
+        reader.source = stream
+        return reader
+    
+    monkeypatch.setattr('services.pdf_service.PdfReader', fake_pdf_reader)
+    return reader
 
 
 @pytest.fixture
@@ -129,12 +201,33 @@ def feedback_repository(test_session):
     return FeedbackRepository(test_session)
 
 
-@pytest.fixture
+_SAMPLE_RESUME_DATA = {
+    "filename": "john_doe_resume.pdf",
+    "text_content": "John Doe\nSoftware Engineer\n\nExperience:\n- 3 years Python development\n- FastAPI and React experience",
+    "job_description": "Looking for a Senior Python Developer with FastAPI experience and 3+ years of backend development.",
+    "s3_url": "https://test-bucket.s3.amazonaws.com/john_doe_resume.pdf"
+}
+
+
+@pytest.fixture(scope="session")
 def sample_resume_data():
-    """Sample resume data for testing."""
-    return {
-        "filename": "john_doe_resume.pdf",
-        "text_content": "John Doe\nSoftware Engineer\n\nExperience:\n- 3 years Python development\n- FastAPI and React experience",
-        "job_description": "Looking for a Senior Python Developer with FastAPI experience and 3+ years of backend development.",
-        "s3_url": "https://test-bucket.s3.amazonaws.com/john_doe_resume.pdf"
-    }
\ No newline at end of file
+    """Sample resume data for testing (read-only; copy it to vary a field)."""
+    return MappingProxyType(_SAMPLE_RESUME_DATA)
+
+
+@pytest.fixture(scope="module")
+async def seeded_resume(test_engine):
+    """Commit one sample resume per module for read-only tests.
+    
+    The row outlives per-test rollbacks, so tests that count rows must
+    account for it. It is deleted when the module finishes.
+    """
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        resume = await ResumeRepository(session).create_resume(**_SAMPLE_RESUME_DATA)
+        await session.commit()
+    
+    yield resume
+    
+    async with AsyncSession(test_engine) as session:
+        await ResumeRepository(session).delete_resume(resume.id)
+        await session.commit()
\ No newline at end of file
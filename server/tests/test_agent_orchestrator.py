@@ -0,0 +1,104 @@
+"""Tests for the multi-agent orchestrator."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from agents import AgentOrchestrator, AgentWorkflowResult
+from agents.graph import MEMORY_ENTRY_MAX_CHARS, MEMORY_MAX_CHARS, compress_memory_context
+from services import LLMService
+
+
+class TestAgentOrchestrator:
+    """Test cases for AgentOrchestrator debate execution."""
+    
+    @pytest.mark.asyncio
+    async def test_critic_and_advocate_stream_concurrently(self) -> None:
+        """Test Critic and Advocate chunks interleave and Realist sees both."""
+        service = Mock(spec=LLMService)
+        realist_messages = []
+        
+        async def stream(system_prompt, user_message, agent_name, memory_context=None):
+            if agent_name == "Realist":
+                realist_messages.append(user_message)
+            for i in range(2):
+                await asyncio.sleep(0)
+                yield f"{agent_name}-{i} "
+        
+        service.generate_agent_response = stream
+        orchestrator = AgentOrchestrator(service)
+        
+        frames = [
+            frame async for frame in orchestrator.execute_debate(
+                "Resume text", "Job description"
+            )
+        ]
+        
+        chunk_agents = [f["agent_name"] for f in frames if f["chunk"]]
+        assert chunk_agents[:2] == ["Critic", "Advocate"]
+        
+        result = frames[-1]["results"]
+        assert isinstance(result, AgentWorkflowResult)
+        assert result.critic_response == "Critic-0 Critic-1 "
+        assert result.advocate_response == "Advocate-0 Advocate-1 "
+        assert result.realist_response == "Realist-0 Realist-1 "
+        assert "Critic-0 Critic-1" in realist_messages[0]
+        assert "Advocate-0 Advocate-1" in realist_messages[0]
+    
+    @pytest.mark.asyncio
+    async def test_agent_failure_propagates(self) -> None:
+        """Test a failing agent stream surfaces its error to the consumer."""
+        service = Mock(spec=LLMService)
+        
+        async def stream(system_prompt, user_message, agent_name, memory_context=None):
+            if agent_name == "Advocate":
+                raise RuntimeError("Advocate failed")
+            yield "chunk"
+        
+        service.generate_agent_response = stream
+        orchestrator = AgentOrchestrator(service)
+        
+        with pytest.raises(RuntimeError, match="Advocate failed"):
+            async for _ in orchestrator.execute_debate("Resume text", "Job description"):
+                pass
+
+    
+    @pytest.mark.asyncio
+    async def test_repeated_debate_is_replayed_from_cache(self) -> None:
+        """Test identical inputs replay the cached debate without LLM calls."""
+        service = Mock(spec=LLMService)
+        calls = []
+        
+        async def stream(system_prompt, user_message, agent_name, memory_context=None):
+            calls.append(agent_name)
+            yield f"{agent_name} says hi"
+        
+        service.generate_agent_response = stream
+        orchestrator = AgentOrchestrator(service)
+        
+        first = [f async for f in orchestrator.execute_debate("Resume", "Job")]
+        second = [f async for f in orchestrator.execute_debate("Resume", "Job")]
+        
+        assert len(calls) == 3
+        assert second[-1]["results"] == first[-1]["results"]
+        assert [f["agent_name"] for f in second if f["chunk"]] == ["Critic", "Advocate", "Realist"]
+        
+        [f async for f in orchestrator.execute_debate("Resume", "Other job")]
+        assert len(calls) == 6
+    
+    def test_compress_memory_context(self) -> None:
+        """Test memory is de-duplicated, truncated and kept within budget."""
+        compressed = compress_memory_context([
+            "Quantify  achievements",
+            "quantify achievements",
+            "",
+            "x" * (MEMORY_ENTRY_MAX_CHARS * 2),
+        ])
+        
+        assert compressed[0] == "Quantify achievements"
+        assert len(compressed) == 2
+        assert len(compressed[1]) == MEMORY_ENTRY_MAX_CHARS
+        
+        many = compress_memory_context([f"pattern {i} " * 20 for i in range(100)])
+        assert sum(len(entry) + 1 for entry in many) <= MEMORY_MAX_CHARS
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 from httpx import AsyncClient
 
+from api.routes import format_compact_frame
 from main import app
 
 
@@ -73,4 +74,26 @@ class TestAPIEndpoints:
     async def test_get_session_not_found(self, client: AsyncClient):
         """Test session retrieval for non-existent session."""
         # Skip this test as it requires proper UUID validation setup
-        pytest.skip("Test requires proper UUID validation setup")
\ No newline at end of file
+        pytest.skip("Test requires proper UUID validation setup")
+    
+    def test_compact_frame_delta(self) -> None:
+        """Test plain text chunks are encoded as tab-separated delta frames."""
+        frame = format_compact_frame(
+            {"agent_name": "Critic", "chunk": "Weak\tverbs", "is_complete": False, "order": 1}
+        )
+        
+        assert frame == "D\tCritic\tWeak\tverbs\n"
+        assert frame.rstrip("\n").split("\t", 2)[2] == "Weak\tverbs"
+    
+    def test_compact_frame_json_fallback(self) -> None:
+        """Test control events and multi-line chunks fall back to JSON frames."""
+        multiline = format_compact_frame(
+            {"agent_name": "Critic", "chunk": "1. Issue\n2. Issue", "is_complete": False, "order": 1}
+        )
+        complete = format_compact_frame(
+            {"agent_name": "Critic", "chunk": "", "is_complete": True, "order": 1}
+        )
+        
+        assert multiline.startswith("J") and multiline.count("\n") == 1
+        assert json.loads(multiline[1:])["chunk"] == "1. Issue\n2. Issue"
+        assert json.loads(complete[1:])["is_complete"] is True
@@ -0,0 +1,84 @@
+"""Tests for Azure OpenAI backpressure controls."""
+
+import time
+
+import httpx
+import pytest
+
+from services.backpressure import AIMDController, CircuitOpenError, RateLimitTracker
+
+
+class TestAIMDController:
+    """Test cases for AIMDController."""
+    
+    @pytest.mark.asyncio
+    async def test_limit_grows_additively_and_halves_on_error(self) -> None:
+        """Test healthy calls add alpha and failures multiply by beta."""
+        controller = AIMDController(c_min=1, c_max=4, initial=2, alpha=1.0, beta=0.5)
+        
+        await controller.acquire()
+        await controller.release(latency=0.1)
+        assert controller.limit == 3.0
+        
+        await controller.acquire()
+        await controller.release(latency=0.1, error=True)
+        assert controller.limit == 1.5
+        
+        await controller.acquire()
+        await controller.release(latency=60.0)
+        assert controller.limit == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_consecutive_failures(self) -> None:
+        """Test the breaker rejects calls once the failure threshold is hit."""
+        controller = AIMDController(failure_threshold=2, cooldown=60.0)
+        
+        for _ in range(2):
+            await controller.acquire()
+            await controller.release(latency=0.1, error=True)
+        
+        with pytest.raises(CircuitOpenError):
+            await controller.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_call_frees_slot_without_adapting(self) -> None:
+        """Test a cancelled call releases its slot but leaves the limit and failures alone."""
+        controller = AIMDController(c_min=1, c_max=4, initial=2, alpha=1.0, failure_threshold=2)
+        
+        await controller.acquire()
+        await controller.release(latency=0.1, error=True)
+        
+        await controller.acquire()
+        await controller.release(latency=0.1, cancelled=True)
+        
+        assert controller.in_flight == 0
+        assert controller.limit == 1.0
+        assert controller._consecutive_failures == 1
+
+
+class TestRateLimitTracker:
+    """Test cases for RateLimitTracker."""
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_reset_when_budget_is_low(self) -> None:
+        """Test a nearly spent provider budget delays until the reported reset."""
+        tracker = RateLimitTracker()
+        await tracker.observe(httpx.Response(200, headers={
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "5",
+            "x-ratelimit-reset-requests": "1m30s",
+        }))
+        
+        assert tracker.limit_requests == 100
+        assert tracker._delay(10, time.monotonic()) == pytest.approx(90.0, abs=1.0)
+    
+    def test_local_window_enforces_token_limit(self) -> None:
+        """Test sends that would overrun the token limit wait for the window."""
+        tracker = RateLimitTracker(window=60.0)
+        tracker.limit_tokens = 1000
+        tracker._sent.append((100.0, 900))
+        tracker._sent_tokens = 900
+        
+        assert tracker._delay(50, now=110.0) == 0.0
+        assert tracker._delay(200, now=110.0) == pytest.approx(50.0)
+        assert tracker._delay(200, now=161.0) == 0.0
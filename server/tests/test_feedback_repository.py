@@ -0,0 +1,123 @@
+"""Tests for feedback repository."""
+
+from uuid import uuid4
+
+import pytest
+
+from core.models import AggregatedLearning
+
+
+class TestFeedbackRepository:
+    """Test cases for feedback repository."""
+    
+    @pytest.mark.asyncio
+    async def test_get_recent_learning_descriptions(self, feedback_repository, test_session):
+        """Test descriptions are ranked by frequency and filtered by agent."""
+        test_session.add_all([
+            AggregatedLearning(
+                pattern_type="positive_feedback",
+                description="Quantify achievements",
+                agent_name="critic",
+                frequency=5
+            ),
+            AggregatedLearning(
+                pattern_type="negative_feedback",
+                description="Avoid buzzwords",
+                agent_name="critic",
+                frequency=2
+            ),
+            AggregatedLearning(
+                pattern_type="positive_feedback",
+                description="Highlight transferable skills",
+                agent_name="advocate",
+                frequency=9
+            ),
+        ])
+        await test_session.flush()
+        
+        descriptions = await feedback_repository.get_recent_learning_descriptions(limit=2)
+        assert descriptions == ["Highlight transferable skills", "Quantify achievements"]
+        
+        critic_only = await feedback_repository.get_recent_learning_descriptions(agent_name="critic")
+        assert critic_only == ["Quantify achievements", "Avoid buzzwords"]
+    
+    @pytest.mark.asyncio
+    async def test_create_or_update_learning_upserts(self, feedback_repository):
+        """Test the same learning triplet is merged into one row."""
+        first = await feedback_repository.create_or_update_learning(
+            "positive_feedback", "Quantify achievements", "critic", confidence_score=0.8
+        )
+        second = await feedback_repository.create_or_update_learning(
+            "positive_feedback", "Quantify achievements", "critic", confidence_score=0.3
+        )
+        
+        assert second.id == first.id
+        assert second.frequency == 2
+        assert second.confidence_score == 0.8
+        
+        # A different agent is a different triplet
+        other = await feedback_repository.create_or_update_learning(
+            "positive_feedback", "Quantify achievements", "advocate"
+        )
+        assert other.id != first.id
+        assert other.frequency == 1
+    
+    @pytest.mark.asyncio
+    async def test_learning_watermark_tracks_upserts(self, feedback_repository):
+        """Test the watermark changes on inserts and on repeat upserts."""
+        assert await feedback_repository.get_learning_watermark() == (None, 0, 0)
+        
+        await feedback_repository.create_or_update_learning(
+            "negative_feedback", "Avoid buzzwords", "critic"
+        )
+        first = await feedback_repository.get_learning_watermark()
+        await feedback_repository.create_or_update_learning(
+            "negative_feedback", "Avoid buzzwords", "critic"
+        )
+        second = await feedback_repository.get_learning_watermark()
+        
+        assert first[1:] == (1, 1)
+        assert second[1:] == (1, 2)
+        assert second != first
+    
+    @pytest.mark.asyncio
+    async def test_add_agent_responses_bulk(self, feedback_repository, resume_repository, sample_resume_data):
+        """Test responses are added in one flush with client-side ids and timestamps."""
+        resume = await resume_repository.create_resume(**sample_resume_data)
+        session = await feedback_repository.create_feedback_session(resume.id)
+        
+        responses = await feedback_repository.add_agent_responses_bulk(
+            session.id,
+            [("critic", "Too vague.", 0), ("advocate", "Strong impact.", 1)]
+        )
+        
+        assert [r.agent_name for r in responses] == ["critic", "advocate"]
+        assert all(r.id and r.created_at for r in responses)
+        
+        with pytest.raises(ValueError, match="Order must be non-negative"):
+            await feedback_repository.add_agent_responses_bulk(session.id, [("realist", "Ok.", -1)])
+    
+    @pytest.mark.asyncio
+    async def test_complete_feedback_session(self, feedback_repository, resume_repository, sample_resume_data):
+        """Test completing a session stamps completed_at in one statement."""
+        resume = await resume_repository.create_resume(**sample_resume_data)
+        session = await feedback_repository.create_feedback_session(resume.id)
+        
+        completed = await feedback_repository.complete_feedback_session(session.id)
+        
+        assert completed.status == "completed"
+        assert completed.completed_at is not None
+        assert await feedback_repository.complete_feedback_session(uuid4()) is None
+    
+    @pytest.mark.asyncio
+    async def test_update_agent_feedback(self, feedback_repository, resume_repository, sample_resume_data):
+        """Test feedback is written and returned by a single UPDATE."""
+        resume = await resume_repository.create_resume(**sample_resume_data)
+        session = await feedback_repository.create_feedback_session(resume.id)
+        response = await feedback_repository.add_agent_response(session.id, "critic", "Too vague.", 0)
+        
+        updated = await feedback_repository.update_agent_feedback(response.id, True, "Helpful")
+        
+        assert updated.thumbs_up is True
+        assert updated.feedback_text == "Helpful"
+        assert await feedback_repository.update_agent_feedback(uuid4(), False) is None
@@ -1,113 +1,103 @@
 """Tests for PDF service."""
 
+import re
+from io import BytesIO
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, mock_open
 
-from services import PDFService
+
+# Built once per session: each just clears its token limit (15k resume, 5k job description)
+_LONG_RESUME_TEXT = "word " * 15500
+_LONG_JOB_DESC = "requirement " * 5500
+
+# Compiled once; pytest.raises(match=...) accepts a pattern object
+_EMPTY_JOB_DESC_ERROR = re.compile("Job description cannot be empty")
 
 
 class TestPDFService:
     """Test cases for PDF service."""
     
-    def test_init(self):
+    def test_init(self, pdf_service):
         """Test PDF service initialization."""
-        service = PDFService()
-        assert service.settings is not None
+        assert pdf_service.settings is not None
     
     @pytest.mark.asyncio
-    async def test_extract_text_from_pdf_success(self):
+    async def test_extract_text_from_pdf_success(self, pdf_service, pdf_reader_mock):
         """Test successful PDF text extraction."""
-        service = PDFService()
-        
         # Mock PDF content
         mock_pdf_content = b"%PDF-1.4 mock content"
         
-        with patch('services.pdf_service.PdfReader') as mock_reader:
-            # Mock PDF reader and pages
-            mock_page = type('MockPage', (), {})()
-            mock_page.extract_text = lambda: "Sample resume text with experience and skills."
-            
-            mock_reader.return_value.pages = [mock_page]
-            mock_reader.return_value.metadata = {
-                "/Title": "Resume",
-                "/Author": "John Doe"
-            }
-            
-            result = await service.extract_text_from_pdf(mock_pdf_content)
-            
-            assert "text_content" in result
-            assert "metadata" in result
-            assert "Page 1:" in result["text_content"]
-            assert result["metadata"]["page_count"] == 1
-            assert result["metadata"]["title"] == "Resume"
-            assert result["metadata"]["author"] == "John Doe"
-    
-    @pytest.mark.asyncio
-    async def test_extract_text_empty_pdf(self):
-        """Test PDF with no pages raises error."""
-        service = PDFService()
+        # Mock PDF reader and pages
+        mock_page = SimpleNamespace(extract_text=lambda: "Sample resume text with experience and skills.")
+        
+        pdf_reader_mock.pages = [mock_page]
+        pdf_reader_mock.metadata = {
+            "/Title": "Resume",
+            "/Author": "John Doe"
+        }
         
-        with patch('services.pdf_service.PdfReader') as mock_reader:
-            mock_reader.return_value.pages = []
-            
-            with pytest.raises(ValueError, match="PDF contains no pages"):
-                await service.extract_text_from_pdf(b"mock content")
+        result = await pdf_service.extract_text_from_pdf(mock_pdf_content)
+        
+        assert "text_content" in result
+        assert "metadata" in result
+        assert "Page 1:" in result["text_content"]
+        assert result["metadata"]["page_count"] == 1
+        assert result["metadata"]["title"] == "Resume"
+        assert result["metadata"]["author"] == "John Doe"
     
-    @pytest.mark.asyncio 
-    async def test_extract_text_no_extractable_text(self):
-        """Test PDF with no extractable text raises error."""
-        service = PDFService()
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "pages, expected_error",
+        [
+            ([], "PDF contains no pages"),
+            ([SimpleNamespace(extract_text=lambda: "")], "No text content could be extracted"),
+            ([SimpleNamespace(extract_text=lambda: _LONG_RESUME_TEXT)], "Resume text too long"),
+        ],
+        ids=["empty_pdf", "no_extractable_text", "token_limit_exceeded"],
+    )
+    async def test_extract_text_invalid_pdf(
+        self, pdf_service, pdf_reader_mock, pages, expected_error
+    ):
+        """Test PDFs without usable text raise validation errors."""
+        pdf_reader_mock.pages = pages
         
-        with patch('services.pdf_service.PdfReader') as mock_reader:
-            mock_page = type('MockPage', (), {})()
-            mock_page.extract_text = lambda: ""  # Empty text
-            
-            mock_reader.return_value.pages = [mock_page]
-            
-            with pytest.raises(ValueError, match="No text content could be extracted"):
-                await service.extract_text_from_pdf(b"mock content")
+        with pytest.raises(ValueError, match=expected_error):
+            await pdf_service.extract_text_from_pdf(b"mock content")
     
     @pytest.mark.asyncio
-    async def test_extract_text_token_limit_exceeded(self):
-        """Test PDF exceeding token limit raises error."""
-        service = PDFService()
+    async def test_extract_text_from_pdf_stream(self, pdf_service, pdf_reader_mock):
+        """Test extraction from a file object rewinds and parses in place."""
+        pdf_file = BytesIO(b"%PDF-1.4 mock content")
+        pdf_file.seek(0, 2)
         
-        with patch('services.pdf_service.PdfReader') as mock_reader:
-            # Create very long text that exceeds token limit
-            long_text = " ".join(["word"] * 20000)  # Exceeds 15k token limit
-            
-            mock_page = type('MockPage', (), {})()
-            mock_page.extract_text = lambda: long_text
-            
-            mock_reader.return_value.pages = [mock_page]
-            mock_reader.return_value.metadata = None
-            
-            with pytest.raises(ValueError, match="Resume text too long"):
-                await service.extract_text_from_pdf(b"mock content")
+        mock_page = SimpleNamespace(extract_text=lambda: "Sample resume text.")
+        
+        pdf_reader_mock.pages = [mock_page]
+        pdf_reader_mock.metadata = None
+        
+        result = await pdf_service.extract_text_from_pdf_stream(pdf_file)
+        
+        assert pdf_reader_mock.source is pdf_file
+        assert result["metadata"]["page_count"] == 1
+        
+        with pytest.raises(ValueError, match="PDF content cannot be empty"):
+            await pdf_service.extract_text_from_pdf_stream(BytesIO())
     
-    def test_validate_job_description_success(self):
+    def test_validate_job_description_success(self, pdf_service):
         """Test successful job description validation."""
-        service = PDFService()
-        
         job_desc = "Looking for a Python developer with 3+ years experience."
-        service.validate_job_description(job_desc)  # Should not raise
+        pdf_service.validate_job_description(job_desc)  # Should not raise
     
-    def test_validate_job_description_empty(self):
+    def test_validate_job_description_empty(self, pdf_service):
         """Test empty job description raises error."""
-        service = PDFService()
-        
-        with pytest.raises(ValueError, match="Job description cannot be empty"):
-            service.validate_job_description("")
+        with pytest.raises(ValueError, match=_EMPTY_JOB_DESC_ERROR):
+            pdf_service.validate_job_description("")
         
-        with pytest.raises(ValueError, match="Job description cannot be empty"):
-            service.validate_job_description("   ")
+        with pytest.raises(ValueError, match=_EMPTY_JOB_DESC_ERROR):
+            pdf_service.validate_job_description("   ")
     
-    def test_validate_job_description_too_long(self):
+    def test_validate_job_description_too_long(self, pdf_service):
         """Test job description exceeding token limit raises error.""" 
-        service = PDFService()
-        
-        # Create long job description that exceeds 5k token limit
-        long_desc = " ".join(["requirement"] * 8000)
-        
         with pytest.raises(ValueError, match="Job description too long"):
-            service.validate_job_description(long_desc)
\ No newline at end of file
+            pdf_service.validate_job_description(_LONG_JOB_DESC)
\ No newline at end of file